@@ -12,6 +12,8 @@ from fastapi.responses import JSONResponse
 from pydantic import BaseModel
 import pytz
 
+_ET = pytz.timezone("America/New_York")
+
 # use shared parse_date to avoid circular imports
 from services.dates import parse_date
 
@@ -240,11 +242,10 @@ class DateOnlyReq(BaseModel):
 # --- Root & health (with explicit HEAD handlers) ---
 @app.get("/", operation_id="root")
 def root():
-    tz = pytz.timezone("America/New_York")
     return {
         "app": APP_NAME,
         "version": APP_VERSION,
-        "date": datetime.now(tz).date().isoformat(),
+        "date": datetime.now(_ET).date().isoformat(),
         "docs": f"{EXTERNAL_URL}/docs",
         "health": f"{EXTERNAL_URL}/health?tz=America/New_York",
     }
@@ -258,7 +259,7 @@ def health(tz: str = Query("America/New_York", description="IANA timezone for ti
     try:
         zone = pytz.timezone(tz)
     except Exception:
-        zone = pytz.timezone("America/New_York")
+        zone = _ET
     now_str = datetime.now(zone).strftime("%Y-%m-%d %H:%M:%S %Z")
     return HealthResp(
         ok=True,
@@ -635,6 +636,14 @@ async def _startup():
     logging.getLogger("uvicorn.access").setLevel(logging.INFO)
     logging.info("MLB Analyzer API startup complete.")
 
+@app.on_event("shutdown")
+def _shutdown():
+    # release pooled HTTP connections held by the provider (if it keeps any);
+    # routers close their own clients through their shutdown handlers
+    close = _callable(provider, "close")
+    if close:
+        close()
+
 if __name__ == "__main__":
     import uvicorn
     # IMPORTANT for Render: no --reload in production
@@ -1,21 +1,38 @@
 # providers/prod_provider.py
 from __future__ import annotations
+import logging
 import os
-from datetime import date as _date
-from typing import Dict, List, Any, Iterable, Optional
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from datetime import date as _date, datetime
+from itertools import accumulate, chain
+from typing import Callable, Dict, List, Any, Iterable, Optional, Tuple
+import pytz
 import requests  # ← real HTTP fetch
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+try:
+    # optional: SQLite-backed HTTP cache so repeated same-day fetches skip the network
+    from requests_cache import CachedSession
+    _REQUESTS_CACHE_OK = True
+except Exception:
+    _REQUESTS_CACHE_OK = False
 from models import Hitter, Pitcher  # avoid circular import with main.py
+from services.json_codec import loads as _json_loads
+
+_logger = logging.getLogger("prod_provider")
+
+# dates of mapped rows kept per instance (hitters and pitchers each)
+_ROWS_MEMO_MAX = 8
+# today's (and future) slates change with live games and lineups; refetch them after this long
+_ROWS_MEMO_TTL = 180.0
+_ET = pytz.timezone("America/New_York")
 
 # Toggle seeded fake rows for quick testing
 _FAKE_ON = os.getenv("PROD_USE_FAKE", "0") in ("1", "true", "True", "YES", "yes")
 
-def _to_dict(x: Any) -> Dict[str, Any]:
-    if hasattr(x, "model_dump"):  # pydantic v2
-        return x.model_dump()
-    if hasattr(x, "dict"):        # pydantic v1
-        return x.dict()
-    return dict(x)
-
 class ProdProvider:
     """
     Real data provider with optional fake-data mode.
@@ -23,6 +40,8 @@ class ProdProvider:
       - PROD_USE_FAKE=1 (optional) to return seeded rows
       - DATA_API_BASE=https://your-data-api.example.com (no trailing slash)
       - DATA_API_KEY=... (optional; sent as Bearer token)
+      - PROD_CACHE_TTL=21600 (seconds; used when requests-cache is installed, 0 disables)
+      - PROD_CACHE_PATH=/tmp/prod_provider_cache.sqlite
     Endpoints (assumed):
       GET {DATA_API_BASE}/hitters?date=YYYY-MM-DD&team=XXX&limit=N
       GET {DATA_API_BASE}/pitchers?date=YYYY-MM-DD&team=XXX&limit=N
@@ -32,10 +51,126 @@ class ProdProvider:
     def __init__(self):
         self.base = (os.getenv("DATA_API_BASE") or "").rstrip("/")
         self.key = os.getenv("DATA_API_KEY") or ""
-        self._session = requests.Session()
+        ttl = int(os.getenv("PROD_CACHE_TTL", "21600"))
+        if _REQUESTS_CACHE_OK and ttl > 0:
+            # keyed on full URL + query, so each date/team/limit combination caches independently
+            self._session = CachedSession(
+                os.getenv("PROD_CACHE_PATH", "/tmp/prod_provider_cache.sqlite"),
+                expire_after=ttl,
+                allowable_methods=("GET",),
+                cache_control=True,
+            )
+        else:
+            self._session = requests.Session()
+        # keep-alive pool sized for concurrent calls; transient 429/5xx retried with backoff
+        retry = Retry(
+            total=3,
+            backoff_factor=0.3,
+            status_forcelist=(429, 500, 502, 503, 504),
+            allowed_methods=frozenset(["GET"]),
+        )
+        adapter = HTTPAdapter(pool_connections=32, pool_maxsize=64, max_retries=retry)
+        self._session.mount("https://", adapter)
+        self._session.mount("http://", adapter)
         if self.key:
             self._session.headers.update({"Authorization": f"Bearer {self.key}"})
-        self._session.headers.update({"User-Agent": "mlb-analyzer/1.0"})
+        self._session.headers.update({"User-Agent": "mlb-analyzer/1.0", "Accept-Encoding": "gzip"})
+        # (stored_at, (mapped rows, side index)) per (date, limit, team); every streak endpoint re-reads the same slate.
+        # The side index is keyed by id(row): it holds precomputed streak summaries outside the rows,
+        # which are returned to API callers as-is, and stays valid because the entry keeps the rows alive.
+        self._hitters_memo: "OrderedDict[tuple, Tuple[float, Tuple[List[Dict[str, Any]], Dict[int, int]]]]" = OrderedDict()
+        self._pitchers_memo: "OrderedDict[tuple, Tuple[float, Tuple[List[Dict[str, Any]], Dict[int, Tuple[List[int], List[int]]]]]]" = OrderedDict()
+        self._memo_lock = threading.Lock()
+
+    def _memo_get(self, memo: OrderedDict, key: tuple) -> Optional[tuple]:
+        with self._memo_lock:
+            rec = memo.get(key)
+            if rec is None:
+                return None
+            stored_at, entry = rec
+            # past dates are final and kept until evicted; anything else expires
+            final = isinstance(key[0], _date) and key[0] < datetime.now(_ET).date()
+            if not final and time.monotonic() - stored_at > _ROWS_MEMO_TTL:
+                del memo[key]
+                return None
+            memo.move_to_end(key)
+            return entry
+
+    def _memo_put(self, memo: OrderedDict, key: tuple, entry: tuple) -> None:
+        if not entry[0]:
+            return  # empty usually means a failed fetch; let the next call retry
+        with self._memo_lock:
+            memo[key] = (time.monotonic(), entry)
+            memo.move_to_end(key)
+            while len(memo) > _ROWS_MEMO_MAX:
+                memo.popitem(last=False)
+
+    # ------------ Mapped rows (fetch + validate once, then plain dicts) ------------
+    def _hitter_slate(
+        self, date: _date, limit: Optional[int] = None, team: Optional[str] = None
+    ) -> Tuple[List[Dict[str, Any]], Dict[int, int]]:
+        """(rows, {id(row): hit streak length}) for the slate."""
+        key = (date, limit, team)
+        cached = self._memo_get(self._hitters_memo, key)
+        if cached is not None:
+            return cached
+        out: List[Dict[str, Any]] = []
+        streaks: Dict[int, int] = {}
+        for r in self._fetch_hitter_rows(date, limit=limit, team=team) or []:
+            if not isinstance(r, dict):
+                continue
+            try:
+                row = self._map_hitter(r).model_dump()
+                seq = row["last_n_hits_each_game"]
+                # hit streak off the front of the log, so the hot filter compares one scalar per row
+                streaks[id(row)] = next((i for i, v in enumerate(seq) if v < 1), len(seq))
+                out.append(row)
+            except Exception as e:
+                _logger.warning("skip hitter row %s: %s: %s", r.get("player_id") or r.get("id"), type(e).__name__, e)
+        entry = (out, streaks)
+        self._memo_put(self._hitters_memo, key, entry)
+        return entry
+
+    def _pitcher_slate(
+        self, date: _date, limit: Optional[int] = None, team: Optional[str] = None
+    ) -> Tuple[List[Dict[str, Any]], Dict[int, Tuple[List[int], List[int]]]]:
+        """(rows, {id(row): (k_prefix_min, ra_prefix_min)}) for the slate."""
+        key = (date, limit, team)
+        cached = self._memo_get(self._pitchers_memo, key)
+        if cached is not None:
+            return cached
+        out: List[Dict[str, Any]] = []
+        prefixes: Dict[int, Tuple[List[int], List[int]]] = {}
+        for r in self._fetch_pitcher_rows(date, limit=limit, team=team) or []:
+            if not isinstance(r, dict):
+                continue
+            try:
+                row = self._map_pitcher(r).model_dump()
+                # running minimum over the first n starts: "every one of the last n" becomes one lookup
+                prefixes[id(row)] = (
+                    list(accumulate(row["k_per_start_last_n"], min)),
+                    list(accumulate(row["runs_allowed_last_n"], min)),
+                )
+                out.append(row)
+            except Exception as e:
+                _logger.warning("skip pitcher row %s: %s: %s", r.get("player_id") or r.get("id"), type(e).__name__, e)
+        entry = (out, prefixes)
+        self._memo_put(self._pitchers_memo, key, entry)
+        return entry
+
+    def get_hitter_rows(self, date: _date, limit: Optional[int] = None, team: Optional[str] = None) -> List[Dict[str, Any]]:
+        return self._hitter_slate(date, limit=limit, team=team)[0]
+
+    def get_pitcher_rows(self, date: _date, limit: Optional[int] = None, team: Optional[str] = None) -> List[Dict[str, Any]]:
+        return self._pitcher_slate(date, limit=limit, team=team)[0]
+
+    # ------------ Typed rows ------------
+    def get_hitters(self, date: _date, limit: Optional[int] = None, team: Optional[str] = None) -> List[Hitter]:
+        # rows were validated when mapped; construct without re-validating
+        return [Hitter.model_construct(**r) for r in self.get_hitter_rows(date, limit=limit, team=team)]
+
+    def get_pitchers(self, date: _date, limit: Optional[int] = None, team: Optional[str] = None) -> List[Pitcher]:
+        return [Pitcher.model_construct(**r) for r in self.get_pitcher_rows(date, limit=limit, team=team)]
 
     # ------------ Public methods used by main.py ------------
     def hot_streak_hitters(
@@ -46,17 +181,13 @@ class ProdProvider:
         require_hit_each: bool = True,
         debug: bool = False,
     ):
-        hitters = self.get_hitters(date)
-        out: List[Dict[str, Any]] = []
-        for h in hitters:
-            if (h.avg or 0.0) < min_avg:
-                continue
-            seq = list(h.last_n_hits_each_game or [])
-            if len(seq) < games:
-                continue
-            if require_hit_each and not all((hits or 0) >= 1 for hits in seq[:games]):
-                continue
-            out.append(_to_dict(h))
+        hitters, streaks = self._hitter_slate(date)
+        out: List[Dict[str, Any]]
+        if require_hit_each:
+            # streak length <= last_n_games, so one compare covers both the length and the per-game check
+            out = [h for h in hitters if h["avg"] >= min_avg and streaks[id(h)] >= games]
+        else:
+            out = [h for h in hitters if h["avg"] >= min_avg and h["last_n_games"] >= games]
         return {"items": out, "meta": {"count": len(out), "min_avg": min_avg, "games": games, "require_hit_each": require_hit_each}} if debug else out
 
     def cold_streak_hitters(
@@ -67,20 +198,38 @@ class ProdProvider:
         require_zero_hit_each: bool = True,
         debug: bool = False,
     ):
-        hitters = self.get_hitters(date)
-        out: List[Dict[str, Any]] = []
+        hitters = self.get_hitter_rows(date)
+        # the reported hitless streak is authoritative; re-deriving it from the log also
+        # depended on log order and rejected rows whose most recent game is last
+        need = "last_n_hitless_games" if require_zero_hit_each else "last_n_games"
+        out: List[Dict[str, Any]] = [h for h in hitters if h["avg"] >= min_avg and h[need] >= games]
+        return {"items": out, "meta": {"count": len(out), "min_avg": min_avg, "games": games, "require_zero_hit_each": require_zero_hit_each}} if debug else out
+
+    @staticmethod
+    def _classify_hitters(
+        hitters: List[Dict[str, Any]],
+        streaks: Dict[int, int],
+        hot_min_avg: float = 0.280,
+        hot_games: int = 3,
+        cold_min_avg: float = 0.275,
+        cold_games: int = 2,
+    ):
+        """
+        One pass over the slate for slate_scan: (hot, cold) with the same predicates as
+        hot_streak_hitters / cold_streak_hitters at their defaults (streak required).
+        """
+        floor = min(hot_min_avg, cold_min_avg)
+        hot: List[Dict[str, Any]] = []
+        cold: List[Dict[str, Any]] = []
         for h in hitters:
-            if (h.avg or 0.0) < min_avg:
-                continue
-            seq = list(h.last_n_hits_each_game or [])
-            if len(seq) < games:
-                continue
-            if require_zero_hit_each and not all((hits or 0) == 0 for hits in seq[:games]):
-                continue
-            if require_zero_hit_each and (h.last_n_hitless_games or 0) < games:
+            avg = h["avg"]
+            if avg < floor:
                 continue
-            out.append(_to_dict(h))
-        return {"items": out, "meta": {"count": len(out), "min_avg": min_avg, "games": games, "require_zero_hit_each": require_zero_hit_each}} if debug else out
+            if avg >= hot_min_avg and streaks[id(h)] >= hot_games:
+                hot.append(h)
+            if avg >= cold_min_avg and h["last_n_hitless_games"] >= cold_games:
+                cold.append(h)
+        return hot, cold
 
     def pitcher_streaks(
         self,
@@ -93,42 +242,69 @@ class ProdProvider:
         cold_last_starts: int = 2,
         debug: bool = False,
     ):
-        pitchers = self.get_pitchers(date)
-        hot: List[Dict[str, Any]] = []
-        cold: List[Dict[str, Any]] = []
-        for p in pitchers:
-            ks = list(p.k_per_start_last_n or [])
-            ra = list(p.runs_allowed_last_n or [])
-            if (p.era or 99.9) <= hot_max_era and len(ks) >= hot_last_starts and all((k or 0) >= hot_min_ks_each for k in ks[:hot_last_starts]):
-                hot.append(_to_dict(p))
-            if (p.era or 0.0) >= cold_min_era and len(ra) >= cold_last_starts and all((r or 0) >= cold_min_runs_each for r in ra[:cold_last_starts]):
-                cold.append(_to_dict(p))
+        pitchers, prefixes = self._pitcher_slate(date)
+        hot, cold = self._classify_pitchers(
+            pitchers, prefixes,
+            hot_max_era, hot_min_ks_each, hot_last_starts,
+            cold_min_era, cold_min_runs_each, cold_last_starts,
+        )
         resp = {"hot_pitchers": hot, "cold_pitchers": cold}
         if debug:
             resp["meta"] = {"counts": {"hot": len(hot), "cold": len(cold)}}
         return resp
 
-    def cold_pitchers(self, date: _date, min_era: float = 4.60, min_runs_each: int = 3, last_starts: int = 2, debug: bool = False):
-        pitchers = self.get_pitchers(date)
-        out: List[Dict[str, Any]] = []
+    @staticmethod
+    def _classify_pitchers(
+        pitchers: List[Dict[str, Any]],
+        prefixes: Dict[int, Tuple[List[int], List[int]]],
+        hot_max_era: float = 4.00,
+        hot_min_ks_each: int = 6,
+        hot_last_starts: int = 3,
+        cold_min_era: float = 4.60,
+        cold_min_runs_each: int = 3,
+        cold_last_starts: int = 2,
+    ):
+        """(hot, cold) over an already-built pitcher slate; shared by pitcher_streaks and slate_scan."""
+        # window checks are fixed for the call; build them once instead of per row
+        hot_ks = _prefix_at_least(hot_last_starts, hot_min_ks_each)
+        cold_ra = _prefix_at_least(cold_last_starts, cold_min_runs_each)
+        hot: List[Dict[str, Any]] = []
+        cold: List[Dict[str, Any]] = []
         for p in pitchers:
-            ra = list(p.runs_allowed_last_n or [])
-            if (p.era or 0.0) >= min_era and len(ra) >= last_starts and all((r or 0) >= min_runs_each for r in ra[:last_starts]):
-                out.append(_to_dict(p))
+            k_min, ra_min = prefixes[id(p)]
+            if (p["era"] or 99.9) <= hot_max_era and hot_ks(k_min):
+                hot.append(p)
+            if (p["era"] or 0.0) >= cold_min_era and cold_ra(ra_min):
+                cold.append(p)
+        return hot, cold
+
+    def cold_pitchers(self, date: _date, min_era: float = 4.60, min_runs_each: int = 3, last_starts: int = 2, debug: bool = False):
+        pitchers, prefixes = self._pitcher_slate(date)
+        cold_ra = _prefix_at_least(last_starts, min_runs_each)
+        out: List[Dict[str, Any]] = [p for p in pitchers if (p["era"] or 0.0) >= min_era and cold_ra(prefixes[id(p)][1])]
         return {"items": out, "meta": {"count": len(out), "min_era": min_era, "min_runs_each": min_runs_each, "last_starts": last_starts}} if debug else out
 
     def slate_scan(self, date: _date, debug: bool = False):
-        hot_hitters = self.hot_streak_hitters(date, debug=False)
-        cold_hitters = self.cold_streak_hitters(date, debug=False)
-        streaks = self.pitcher_streaks(date, debug=False)
-        hot_pitchers = streaks.get("hot_pitchers", [])
-        cold_pitchers = streaks.get("cold_pitchers", [])
-        pid_index = {p["player_id"]: p for p in (hot_pitchers + cold_pitchers)}
+        # the hitter and pitcher fetches are independent round-trips; overlap them
+        with ThreadPoolExecutor(max_workers=2) as pool:
+            hitters_f = pool.submit(self._hitter_slate, date)
+            pitchers_f = pool.submit(self._pitcher_slate, date)
+            hitters, hit_streaks = hitters_f.result()  # one fetch feeds both hitter filters
+            pitchers, prefixes = pitchers_f.result()
+        hot_hitters, cold_hitters = self._classify_hitters(hitters, hit_streaks)
+        hot_pitchers, cold_pitchers = self._classify_pitchers(pitchers, prefixes)
+        pid_index: Dict[str, Dict[str, Any]] = {}
+        # rows without probable_pitcher_id still match through the opponent's flagged probable starter
+        opp_index: Dict[str, Dict[str, Any]] = {}
+        for p in chain(hot_pitchers, cold_pitchers):
+            pid_index[p["player_id"]] = p
+            if p["is_probable"]:
+                opp_index[p["team"]] = p
         matchups: List[Dict[str, Any]] = []
-        for h in (hot_hitters if isinstance(hot_hitters, list) else hot_hitters.get("items", [])):
+        for h in hot_hitters:
             pid = h.get("probable_pitcher_id")
-            if pid and pid in pid_index:
-                p = pid_index[pid]
+            p = pid_index.get(pid) if pid else opp_index.get(h.get("opponent_team"))
+            if p is not None:
                 matchups.append({
                     "hitter_id": h["player_id"],
                     "hitter_name": h["name"],
@@ -140,8 +316,8 @@ class ProdProvider:
                     "note": "Hot hitter vs probable pitcher",
                 })
         out = {
-            "hot_hitters": hot_hitters if isinstance(hot_hitters, list) else hot_hitters.get("items", []),
-            "cold_hitters": cold_hitters if isinstance(cold_hitters, list) else cold_hitters.get("items", []),
+            "hot_hitters": hot_hitters,
+            "cold_hitters": cold_hitters,
             "hot_pitchers": hot_pitchers,
             "cold_pitchers": cold_pitchers,
             "matchups": matchups,
@@ -159,11 +335,11 @@ class ProdProvider:
         try:
             r = self._session.get(url, params=params, timeout=10)
             r.raise_for_status()
-            data = r.json()
+            data = _json_loads(r.content)
             # Some APIs wrap results in {"data": [...]}
             return data.get("data", data)
         except Exception as e:
-            print(f"[prod_provider] GET {url} params={params} -> {type(e).__name__}: {e}")
+            _logger.warning("GET %s params=%s -> %s: %s", url, params, type(e).__name__, e)
             return []
 
     # ------------ Raw fetches (fake or real) ------------
@@ -263,13 +439,22 @@ def _first(r: Dict[str, Any], *keys: str):
             return r[k]
     return None
 
+def _prefix_at_least(n: int, floor: int) -> Callable[[List[int]], bool]:
+    """Predicate over a prefix-min list: >= n entries and each of the first n is >= floor."""
+    if n <= 0:
+        return lambda prefix_min: True
+    last = n - 1
+    return lambda prefix_min: len(prefix_min) > last and prefix_min[last] >= floor
+
 def _as_float(x: Any) -> Optional[float]:
+    # None and numbers never raise; only text pays for the try block
+    if x is None:
+        return None
+    if isinstance(x, (int, float)):
+        return float(x)
     try:
-        if x is None: return None
-        if isinstance(x, (int, float)): return float(x)
-        s = str(x).strip().replace("%", "")
-        return float(s)
-    except Exception:
+        return float(str(x).strip().replace("%", ""))
+    except (TypeError, ValueError):
         return None
 
 def _as_int(x: Any) -> Optional[int]:
@@ -278,35 +463,23 @@ def _as_int(x: Any) -> Optional[int]:
     except Exception:
         return None
 
+def _int_or_zero(v: Any) -> int:
+    if type(v) is int:
+        return v  # the common case; skip the try/except setup
+    try:
+        return int(v) if v is not None else 0
+    except Exception:
+        return 0
+
 def _as_int_list(x: Any) -> List[int]:
-    if x is None: return []
-    if isinstance(x, list): 
-        out = []
-        for v in x:
-            try: out.append(int(v))
-            except Exception: out.append(0)
-        return out
+    if isinstance(x, list):
+        return [_int_or_zero(v) for v in x]
     return []
 
 def _extract_ints_from_logs(logs: List[Dict[str, Any]], keys: Iterable[str]) -> List[int]:
-    out: List[int] = []
-    for row in logs[:10]:  # cap to last ~10 entries
-        val = None
-        for k in keys:
-            if k in row:
-                val = row.get(k)
-                break
-        try:
-            out.append(int(val if val is not None else 0))
-        except Exception:
-            out.append(0)
-    return out
-
-def _safe_float(x: Optional[Any]) -> Optional[float]:
-    try:
-        return float(x) if x is not None else None
-    except Exception:
-        return None
+    keys = tuple(keys)
+    # cap to last ~10 entries; the first key present in a row wins (even when its value is None)
+    return [_int_or_zero(next((row[k] for k in keys if k in row), None)) for row in logs[:10]]
 
 def _fake_hitter_rows(game_date: _date) -> List[Dict[str, Any]]:
     return [
@@ -1,23 +1,59 @@
 # providers/statsapi_client.py
 from __future__ import annotations
 
+import os
 import time
 import json
+import logging
 import random
-from typing import Any, Dict, Optional, Tuple
+import sqlite3
+import threading
+import zlib
+from datetime import datetime
+from typing import Any, Dict, Iterable, List, Optional, Tuple, Union
 
-import requests
+import httpx
+import pytz
+
+from services.json_codec import loads as _json_loads
+
+# HTTP/2 is only available when the optional `h2` package is installed.
+try:
+    import h2  # noqa: F401
+    HTTP2_AVAILABLE = True
+except Exception:
+    HTTP2_AVAILABLE = False
 
 BASE = "https://statsapi.mlb.com/api/v1"
+_logger = logging.getLogger("statsapi")
+# schedule projection for callers that only need game status + teams
+SCHEDULE_MIN_FIELDS = (
+    "dates,date,games,gamePk,status,detailedState,abstractGameState,statusCode,"
+    "teams,home,away,team,id,name"
+)
+# people projection for the hitting season/gameLog hydrate (streak + season avg reads only)
+PEOPLE_HITTING_FIELDS = (
+    "people,id,fullName,stats,type,group,displayName,splits,date,stat,avg,atBats,hits"
+)
+# same projection for a bare /people/{id}/stats reply
+STATS_HITTING_FIELDS = "stats,type,group,displayName,splits,date,stat,avg,atBats,hits"
+# roster projection: who is on it and whether they pitch
+ROSTER_MIN_FIELDS = "roster,person,id,fullName,primaryPosition,position,code,abbreviation"
+# rosters and season/gameLog stats only move a few times a day; live schedules keep the client default
+SLOW_TTL_SECONDS = 900
+# only these statuses (plus transport errors) are worth retrying; other 4xx fail fast
+RETRY_STATUSES = frozenset({429, 500, 502, 503, 504})
 
 
 class _TTLCache:
-    """Lightweight in-memory TTL cache (thread-unsafe, fine for single-process web app)."""
+    """Lightweight in-memory TTL cache; a lock guards the store since providers fan out over threads."""
     def __init__(self, ttl_seconds: int = 120, maxsize: int = 2048):
         self.ttl = ttl_seconds
         self.maxsize = maxsize
         self._store: Dict[str, Tuple[float, Any]] = {}
+        self._lock = threading.Lock()
 
+    # entries are stored as (expires_at, value) so callers can pick a TTL per key
     def _evict_if_needed(self) -> None:
         if len(self._store) <= self.maxsize:
             return
@@ -30,15 +66,127 @@ class _TTLCache:
         rec = self._store.get(key)
         if not rec:
             return None
-        ts, val = rec
-        if (time.time() - ts) > self.ttl:
-            self._store.pop(key, None)
+        expires_at, val = rec
+        if time.time() > expires_at:
+            with self._lock:
+                self._store.pop(key, None)
             return None
         return val
 
-    def set(self, key: str, val: Any) -> None:
-        self._store[key] = (time.time(), val)
-        self._evict_if_needed()
+    def set(self, key: str, val: Any, ttl: Optional[float] = None) -> None:
+        with self._lock:
+            self._store[key] = (time.time() + (self.ttl if ttl is None else ttl), val)
+            self._evict_if_needed()
+
+
+class _AdaptiveLimiter:
+    """
+    Shared client-side token bucket whose refill rate adapts to throttling.
+    A 429 halves the rate and blocks every caller until Retry-After (or one token
+    interval) has passed; successful responses recover the rate additively, scaled
+    down while the EWMA of recent 429s is still high.
+    """
+    def __init__(self, rate: float = 20.0, burst: int = 20, min_rate: float = 1.0, alpha: float = 0.2):
+        if min_rate <= 0:
+            raise ValueError(f"min_rate must be > 0, got {min_rate!r}")
+        self.min_rate = float(min_rate)
+        # STATSAPI_RATE=0 (or negative) would divide by zero on the first wait; floor it at min_rate
+        self.max_rate = max(self.min_rate, float(rate))
+        self.rate = self.max_rate
+        self.burst = float(burst)
+        self.alpha = alpha
+        self.tokens = float(burst)
+        self.throttle_ewma = 0.0
+        self._last = time.monotonic()
+        self._blocked_until = 0.0
+        self._lock = threading.Lock()
+
+    def acquire(self) -> None:
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                if now < self._blocked_until:
+                    delay = self._blocked_until - now
+                else:
+                    self.tokens = min(self.burst, self.tokens + (now - self._last) * self.rate)
+                    self._last = now
+                    if self.tokens >= 1.0:
+                        self.tokens -= 1.0
+                        return
+                    delay = (1.0 - self.tokens) / self.rate
+            time.sleep(delay)
+
+    def observe(self, status: int, retry_after: Optional[str] = None) -> None:
+        throttled = status == 429
+        with self._lock:
+            self.throttle_ewma = (1 - self.alpha) * self.throttle_ewma + self.alpha * (1.0 if throttled else 0.0)
+            if throttled:
+                self.rate = max(self.min_rate, self.rate * 0.5)
+                try:
+                    delay = float(retry_after) if retry_after else 1.0 / self.rate
+                except ValueError:
+                    delay = 1.0 / self.rate  # HTTP-date form: fall back to one token interval
+                self._blocked_until = max(self._blocked_until, time.monotonic() + delay)
+                self.tokens = 0.0
+            elif self.rate < self.max_rate:
+                self.rate = min(self.max_rate, self.rate + 0.05 * self.max_rate * (1.0 - self.throttle_ewma))
+
+
+class _DiskCache:
+    """
+    SQLite-backed store for responses that can never change (finished dates, past seasons).
+    Raw response bytes are kept so a warm process start skips both the fetch and re-encoding;
+    they are zlib-compressed on write (StatsAPI JSON shrinks ~10x). Rows written before
+    compression are plain JSON and are returned as-is.
+    """
+    def __init__(self, directory: str):
+        os.makedirs(directory, exist_ok=True)
+        self._db = sqlite3.connect(os.path.join(directory, "statsapi.sqlite3"), check_same_thread=False)
+        self._db.execute("CREATE TABLE IF NOT EXISTS responses (key TEXT PRIMARY KEY, body BLOB NOT NULL)")
+        self._db.commit()
+        self._lock = threading.Lock()
+
+    def get(self, key: str) -> Optional[bytes]:
+        with self._lock:
+            row = self._db.execute("SELECT body FROM responses WHERE key = ?", (key,)).fetchone()
+        if not row:
+            return None
+        body = bytes(row[0])
+        # JSON starts with '{' or '['; anything else is a compressed row
+        return body if body[:1] in (b"{", b"[") else zlib.decompress(body)
+
+    def set(self, key: str, body: bytes) -> None:
+        packed = zlib.compress(body, 6)
+        with self._lock:
+            self._db.execute("INSERT OR REPLACE INTO responses (key, body) VALUES (?, ?)", (key, packed))
+            self._db.commit()
+
+    def close(self) -> None:
+        with self._lock:
+            self._db.close()
+
+
+_EASTERN = pytz.timezone("America/New_York")
+
+
+def _is_immutable(path: str, params: Optional[Dict[str, Any]]) -> bool:
+    """
+    True when the response is historical and final: schedules for dates before today (ET)
+    and people/stats lookups for a season before the current one.
+    """
+    p = params or {}
+    today = datetime.now(_EASTERN).date()
+    if path == "/schedule":
+        last = str(p.get("endDate") or p.get("date") or "")
+        return len(last) == 10 and last < today.isoformat()
+    if path.startswith("/people"):
+        season = str(p.get("season") or "")
+        if not season:
+            hydrate = str(p.get("hydrate") or "")
+            i = hydrate.find("season=")
+            season = hydrate[i + 7:i + 11] if i >= 0 else ""
+        return season.isdigit() and int(season) < today.year
+    return False
 
 
 def _mk_key(path: str, params: Optional[Dict[str, Any]]) -> str:
@@ -49,6 +197,8 @@ def _mk_key(path: str, params: Optional[Dict[str, Any]]) -> str:
 class StatsApiClient:
     """
     Small HTTP client for MLB StatsAPI with TTL caching + retries.
+    One keep-alive httpx.Client is reused for every request (HTTP/2 when `h2` is installed);
+    safe to share across worker threads.
     """
 
     def __init__(
@@ -57,62 +207,191 @@ class StatsApiClient:
         ttl_seconds: int = 120,
         timeout: int = 30,
         max_retries: int = 3,
+        max_connections: int = 128,
+        max_keepalive_connections: int = 64,
+        rate_per_sec: float = 20.0,
+        limiter: Optional[_AdaptiveLimiter] = None,
+        cache_dir: Optional[str] = None,
     ):
         self.base = base_url.rstrip("/")
         self.cache = _TTLCache(ttl_seconds=ttl_seconds)
         self.timeout = timeout
         self.max_retries = max_retries
+        # key -> (etag, decoded body); lets expired cache entries revalidate with a 304
+        self._etags: Dict[str, Tuple[str, Any]] = {}
+        self._etag_maxsize = 2048
+        self._etag_lock = threading.Lock()
+        # L2 for historical responses; opt-in via cache_dir or STATSAPI_CACHE_DIR
+        cache_dir = cache_dir or os.getenv("STATSAPI_CACHE_DIR")
+        self.disk: Optional[_DiskCache] = _DiskCache(cache_dir) if cache_dir else None
+        # every request (across threads) draws from one adaptive bucket
+        self.limiter = limiter or _AdaptiveLimiter(rate=rate_per_sec, burst=max(1, int(rate_per_sec)))
+        self._http = httpx.Client(
+            http2=HTTP2_AVAILABLE,
+            timeout=timeout,
+            limits=httpx.Limits(
+                max_connections=max_connections,
+                max_keepalive_connections=max_keepalive_connections,
+            ),
+            headers={"Accept": "application/json"},
+        )
+
+    def close(self) -> None:
+        self._http.close()
+        if self.disk is not None:
+            self.disk.close()
+
+    def __enter__(self) -> "StatsApiClient":
+        return self
 
-    def _log(self, msg: str) -> None:
-        print(f"[StatsApiClient] {msg}", flush=True)
+    def __exit__(self, *exc) -> None:
+        self.close()
 
-    def get(self, path: str, params: Optional[Dict[str, Any]] = None, use_cache: bool = True) -> Dict[str, Any]:
+    def get(
+        self,
+        path: str,
+        params: Optional[Dict[str, Any]] = None,
+        use_cache: bool = True,
+        ttl: Optional[float] = None,
+    ) -> Dict[str, Any]:
         url = f"{self.base}{path}"
         key = _mk_key(path, params)
 
         if use_cache:
             cached = self.cache.get(key)
             if cached is not None:
-                self._log(f"CACHE HIT {url} params={params}")
+                _logger.debug("CACHE HIT %s params=%s", url, params)
                 return cached
 
+        immutable = use_cache and self.disk is not None and _is_immutable(path, params)
+        if immutable:
+            blob = self.disk.get(key)
+            if blob is not None:
+                _logger.debug("DISK HIT %s params=%s", url, params)
+                data = _json_loads(blob)
+                self.cache.set(key, data, ttl)
+                return data
+
         attempt = 0
         wait = 0.5
         while True:
             attempt += 1
             try:
-                self._log(f"GET {url} params={params}")
-                r = requests.get(url, params=params or {}, timeout=self.timeout)
-                self._log(f"HTTP {r.status_code} for {url}")
-                r.raise_for_status()
-                data = r.json()
+                tagged = self._etags.get(key)
+                headers = {"If-None-Match": tagged[0]} if tagged else None
+                self.limiter.acquire()
+                _logger.debug("GET %s params=%s", url, params)
+                r = self._http.get(url, params=params or {}, headers=headers)
+                _logger.debug("HTTP %s for %s", r.status_code, url)
+                self.limiter.observe(r.status_code, r.headers.get("Retry-After"))
+                if r.status_code == 304 and tagged:
+                    data = tagged[1]
+                else:
+                    r.raise_for_status()
+                    data = _json_loads(r.content)
+                    if immutable:
+                        self.disk.set(key, r.content)
+                    etag = r.headers.get("ETag")
+                    if etag:
+                        self._remember_etag(key, etag, data)
                 if use_cache:
-                    self.cache.set(key, data)
+                    self.cache.set(key, data, ttl)
                 return data
-            except requests.RequestException as e:
+            except httpx.HTTPError as e:
+                if isinstance(e, httpx.HTTPStatusError) and e.response.status_code not in RETRY_STATUSES:
+                    _logger.warning("HTTP %s (not retried) for %s", e.response.status_code, url)
+                    raise
                 if attempt >= self.max_retries:
-                    self._log(f"ERROR giving up after {attempt} attempts: {type(e).__name__}")
+                    _logger.warning("giving up on %s after %d attempts: %s", url, attempt, type(e).__name__)
                     raise
+                if isinstance(e, httpx.HTTPStatusError) and e.response.status_code == 429:
+                    # the limiter already holds every caller until Retry-After; no extra blind backoff
+                    _logger.info("Throttled (429). Retry %d/%d at %.1f req/s", attempt, self.max_retries, self.limiter.rate)
+                    continue
                 sleep_for = wait + random.random() * 0.5 * wait
-                self._log(f"Transient error ({type(e).__name__}). Retry {attempt}/{self.max_retries} in {sleep_for:.2f}s")
+                _logger.info("Transient error (%s). Retry %d/%d in %.2fs", type(e).__name__, attempt, self.max_retries, sleep_for)
                 time.sleep(sleep_for)
                 wait = min(8.0, wait * 1.7)
 
+    def _remember_etag(self, key: str, etag: str, data: Any) -> None:
+        with self._etag_lock:
+            self._etags.pop(key, None)
+            self._etags[key] = (etag, data)
+            if len(self._etags) > self._etag_maxsize:
+                # dicts keep insertion order: drop the oldest validator
+                self._etags.pop(next(iter(self._etags)), None)
+
     # Convenience wrappers
     def schedule(self, date_str: str, hydrate: Optional[str] = None) -> Dict[str, Any]:
-        params = {"date": date_str, "sportId": 1}
+        params: Dict[str, Any] = {"date": date_str, "sportId": 1}
         if hydrate:
             params["hydrate"] = hydrate
         return self.get("/schedule", params)
 
-    def team_roster(self, team_id: int, roster_type: str = "active") -> Dict[str, Any]:
-        return self.get(f"/teams/{team_id}/roster", {"rosterType": roster_type})
+    def schedule_minimal(self, date_str: str, team_id: Optional[int] = None) -> Dict[str, Any]:
+        """Schedule trimmed server-side (`fields=`) to game status + team id/name."""
+        params: Dict[str, Any] = {"date": date_str, "sportId": 1, "fields": SCHEDULE_MIN_FIELDS}
+        if team_id is not None:
+            params["teamId"] = team_id
+        return self.get("/schedule", params)
 
-    def player_stats(self, player_id: int, season: int, stat_type: str) -> Dict[str, Any]:
-        return self.get(
-            f"/people/{player_id}/stats",
-            {"stats": stat_type, "group": "hitting", "season": season}
-        )
+    def team_roster(
+        self,
+        team_id: int,
+        roster_type: str = "active",
+        season: Optional[int] = None,
+        fields: Optional[str] = None,
+    ) -> Dict[str, Any]:
+        """fields= (e.g. ROSTER_MIN_FIELDS) trims the reply server-side; omit it for the full roster."""
+        params: Dict[str, Any] = {"rosterType": roster_type}
+        if season is not None:
+            params["season"] = season
+        if fields:
+            params["fields"] = fields
+        return self.get(f"/teams/{team_id}/roster", params, ttl=SLOW_TTL_SECONDS)
+
+    def player_stats(
+        self,
+        player_id: int,
+        season: int,
+        stat_type: Union[str, List[str]],
+        group: Optional[str] = None,
+        fields: Optional[str] = None,
+    ) -> Dict[str, Any]:
+        """
+        stat_type may be a list (e.g. ["season", "gameLog"]) to get several blocks in one response.
+        group ("hitting"/"pitching") and fields= (e.g. STATS_HITTING_FIELDS) are only sent when given.
+        """
+        if not isinstance(stat_type, str):
+            stat_type = ",".join(stat_type)
+        params: Dict[str, Any] = {"stats": stat_type, "season": season}
+        if group:
+            params["group"] = group
+        if fields:
+            params["fields"] = fields
+        return self.get(f"/people/{player_id}/stats", params, ttl=SLOW_TTL_SECONDS)
+
+    def people_with_stats(self, ids: Iterable[int], season: int, chunk: int = 100) -> Dict[int, Dict[str, Any]]:
+        """
+        Batched /people lookup hydrated with hitting season + gameLog stats, trimmed
+        server-side (`fields=`) to what the streak scan reads.
+        Returns {person_id: person}; ids missing from the response are simply absent
+        so callers can fall back to player_stats() for them.
+        """
+        uniq = sorted({int(i) for i in ids})
+        out: Dict[int, Dict[str, Any]] = {}
+        for i in range(0, len(uniq), chunk):
+            sub = uniq[i:i + chunk]
+            data = self.get("/people", {
+                "personIds": ",".join(str(x) for x in sub),
+                "hydrate": f"stats(group=[hitting],type=[season,gameLog],season={season})",
+                "fields": PEOPLE_HITTING_FIELDS,
+            }, ttl=SLOW_TTL_SECONDS)
+            for p in data.get("people", []) or []:
+                pid = p.get("id")
+                if pid is not None:
+                    out[int(pid)] = p
+        return out
 
     def boxscore(self, game_pk: int) -> Dict[str, Any]:
         return self.get(f"/game/{game_pk}/boxscore")
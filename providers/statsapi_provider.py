@@ -1,11 +1,20 @@
 # providers/statsapi_provider.py
 import os
+import heapq
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 import pytz
 import unicodedata
-import requests
+from functools import lru_cache
+
+from services.statsapi_json import dig as _dig, is_pitcher_entry as _is_pitcher
+
+from .statsapi_client import ROSTER_MIN_FIELDS, STATS_HITTING_FIELDS, StatsApiClient
 
 DEFAULT_BASE = "https://statsapi.mlb.com"
+_ET = pytz.timezone("America/New_York")
+# concurrent StatsAPI requests per scan (roster + per-player fallbacks are network bound)
+_MAX_WORKERS = int(os.getenv("STATSAPI_MAX_WORKERS", "16"))
 
 # We only want players whose team has NOT started yet
 NOT_STARTED_DETAILED = {"Scheduled", "Pre-Game", "Warmup"}
@@ -13,8 +22,7 @@ NOT_STARTED_ABSTRACT = {"Preview"}  # sometimes abstract is Preview before first
 
 
 def _tz_today_eastern():
-    tz = pytz.timezone("America/New_York")
-    return datetime.now(tz).date()
+    return datetime.now(_ET).date()
 
 
 def _parse_date(d):
@@ -23,40 +31,54 @@ def _parse_date(d):
     return str(d)
 
 
+@lru_cache(maxsize=128)
+def _season_of(dstr):
+    # raises on malformed input, and lru_cache never stores a raised call
+    return int(dstr[:4])
+
+
 def _season_from_date(dstr):
     try:
-        return int(dstr[:4])
+        return _season_of(dstr)
     except Exception:
         return _tz_today_eastern().year
 
 
+# punctuation dropped from names in a single translate() pass
+_NAME_PUNCT = str.maketrans("", "", ".,'`’")
+
+
+@lru_cache(maxsize=8192)
 def _normalize_name(s):
     """strip accents, punctuation, lowercase, and drop Jr/Sr/II/III suffix"""
     if not s:
         return ""
-    s = unicodedata.normalize("NFKD", s)
-    s = "".join(ch for ch in s if not unicodedata.combining(ch))
-    s = s.lower()
-    for ch in [".", ",", "'", "`", "’"]:
-        s = s.replace(ch, "")
-    s = " ".join(s.split())
-    tokens = s.split()
+    if not s.isascii():
+        # plain-ASCII names (the common case) have no accents to strip
+        s = unicodedata.normalize("NFKD", s)
+        s = "".join(ch for ch in s if not unicodedata.combining(ch))
+    tokens = s.lower().translate(_NAME_PUNCT).split()
     if tokens and tokens[-1] in {"jr", "sr", "ii", "iii"}:
         tokens = tokens[:-1]
     return " ".join(tokens)
 
 
+def _stat_blocks(person):
+    """
+    index the stats blocks of a hydrated person or a /people/{id}/stats reply by type
+    displayName ('season', 'gameLog', ...) in one pass; the first block of a type wins
+    """
+    out = {}
+    for blk in (person or {}).get("stats") or []:
+        out.setdefault(_dig(blk, "type", "displayName"), blk)
+    return out
+
+
 def _get_base():
     base = os.getenv("STATSAPI_BASE", DEFAULT_BASE)
     return base.rstrip("/")
 
 
-def _get(url, params=None, timeout=10):
-    r = requests.get(url, params=params, timeout=timeout)
-    r.raise_for_status()
-    return r.json()
-
-
 class StatsApiProvider:
     """
     Provider that talks directly to MLB StatsAPI.
@@ -66,6 +88,15 @@ class StatsApiProvider:
 
     def __init__(self):
         self.base = _get_base()
+        # one pooled keep-alive client for every StatsAPI call made by this provider
+        self.client = StatsApiClient(
+            base_url=f"{self.base}/api/v1",
+            timeout=10,
+            rate_per_sec=float(os.getenv("STATSAPI_RATE", "20")),
+        )
+
+    def close(self):
+        self.client.close()
 
     # ---------------------------
     # Minimal probes for self_test
@@ -79,9 +110,7 @@ class StatsApiProvider:
 
     def schedule_for_date(self, date):
         d = _parse_date(date)
-        url = f"{self.base}/api/v1/schedule"
-        params = {"sportId": 1, "date": d}
-        return _get(url, params=params)
+        return self.client.schedule(d)
 
     # ---------------------------
     # League-level stub (keeps self_test GREEN without 501s)
@@ -120,45 +149,62 @@ class StatsApiProvider:
           • season_avg >= min_season_avg
           • hitless_streak >= min_hitless_games
           • and their team has not started yet today
+        `team` (id or name fragment) limits the roster scan to that club.
         """
         d = _parse_date(date)
         season = _season_from_date(d)
-        base = self.base
 
-        # 1) Which teams have NOT started?
-        sched = self.schedule_for_date(d)
+        # 1) Which teams have NOT started? A numeric team hint narrows the schedule server-side.
+        team_hint = str(team).strip() if team is not None else ""
+        team_id_hint = int(team_hint) if team_hint.isdigit() else None
+        sched = self.client.schedule_minimal(d, team_id=team_id_hint)
         not_started_team_ids = set()
         team_id_to_name = {}
         for dt in sched.get("dates", []):
             for g in dt.get("games", []):
-                st = g.get("status", {})
+                st = g.get("status") or {}
                 detailed = st.get("detailedState")
                 abstract = st.get("abstractGameState")
                 if (detailed in NOT_STARTED_DETAILED) or (abstract in NOT_STARTED_ABSTRACT and detailed != "Final"):
                     for side in ("away", "home"):
-                        t = g.get("teams", {}).get(side, {}).get("team", {})
+                        t = _dig(g, "teams", side, "team")
                         if t and "id" in t:
                             not_started_team_ids.add(t["id"])
                             team_id_to_name[t["id"]] = t.get("name", "")
 
-        # 2) Build name -> player mapping from ACTIVE rosters of those teams
-        name_to_player = {}  # normalized name -> (playerId, teamId, teamName, fullName)
-        for tid in sorted(not_started_team_ids):
+        if team_id_hint:
+            # teamId also returns the opponent; keep only the requested club
+            not_started_team_ids &= {team_id_hint}
+        elif team_hint:
+            want = _normalize_name(team_hint)
+            not_started_team_ids = {tid for tid in not_started_team_ids if want in _normalize_name(team_id_to_name.get(tid, ""))}
+
+        # 2) Build name -> player mapping from ACTIVE rosters of those teams (fetched concurrently)
+        def _roster(tid):
             try:
-                roster_url = f"{base}/api/v1/teams/{tid}/roster"
-                params = {"rosterType": "active", "season": season}
-                rj = _get(roster_url, params=params)
-                for entry in rj.get("roster", []):
-                    person = entry.get("person", {})
-                    pid = person.get("id")
-                    full = person.get("fullName", "")
-                    if not pid or not full:
-                        continue
-                    norm = _normalize_name(full)
-                    name_to_player[norm] = (pid, tid, team_id_to_name.get(tid, ""), full)
+                return tid, self.client.team_roster(tid, "active", season, fields=ROSTER_MIN_FIELDS)
             except Exception:
                 # skip roster failures; we'll just have fewer matches
-                pass
+                return tid, {}
+
+        name_to_player = {}  # normalized name -> (playerId, teamId, teamName, fullName)
+        pitcher_names = set()  # normalized names skipped as pitchers, so debug can say why
+        team_order = sorted(not_started_team_ids)
+        with ThreadPoolExecutor(max_workers=max(1, min(_MAX_WORKERS, len(team_order)))) as pool:
+            rosters = list(pool.map(_roster, team_order))
+        for tid, rj in rosters:
+            for entry in rj.get("roster", []):
+                person = entry.get("person") or {}
+                pid = person.get("id")
+                full = person.get("fullName", "")
+                if not pid or not full:
+                    continue
+                norm = _normalize_name(full)
+                if _is_pitcher(entry):
+                    # never a cold-hitter candidate; skip before any stats call
+                    pitcher_names.add(norm)
+                    continue
+                name_to_player[norm] = (pid, tid, team_id_to_name.get(tid, ""), full)
 
         # 3) Parse requested names
         requested = []
@@ -174,95 +220,116 @@ class StatsApiProvider:
         items = []
         dbg = []
 
-        # 4) For each requested player, compute filters and metrics
+        # 4) Resolve names, then pull season + gameLog for every match in batched /people calls
+        resolved = []
         for raw_name in requested:
-            norm_req = _normalize_name(raw_name)
-            info = name_to_player.get(norm_req)
+            norm = _normalize_name(raw_name)
+            info = name_to_player.get(norm)
             if not info:
-                if debug:
+                if debug and norm in pitcher_names:
+                    dbg.append({"name": raw_name, "skip": "pitcher (not a cold-hitter candidate)"})
+                elif debug:
                     dbg.append({
                         "name": raw_name,
                         "skip": "no not-started game today (not found on any active roster of a not-started team)"
                     })
                 continue
+            resolved.append(info)
 
-            pid, tid, team_name, full = info
-
-            # Season average
+        people = {}
+        if resolved:
             try:
-                stats_url = f"{base}/api/v1/people/{pid}/stats"
-                sj = _get(stats_url, params={"stats": "season", "season": season})
-                avg = 0.0
-                for sp in sj.get("stats", []):
-                    for split in sp.get("splits", []):
-                        stat = split.get("stat", {})
-                        a = stat.get("avg")
-                        if a is not None:
-                            try:
-                                avg = float(a)
-                            except Exception:
-                                pass
-                if avg < float(min_season_avg):
-                    if debug:
-                        dbg.append({"name": full, "team": team_name, "skip": f"season_avg {avg:.3f} < min {float(min_season_avg):.3f}"})
-                    continue
+                people = self.client.people_with_stats([info[0] for info in resolved], season)
             except Exception as e:
+                # per-player calls below still work without the batch
                 if debug:
-                    dbg.append({"name": full, "team": team_name, "error": f"season stats fetch failed: {e}"})
-                continue
-
-            # Hitless streak across recent AB>0 games
-            try:
-                gl_url = f"{base}/api/v1/people/{pid}/stats"
-                glj = _get(gl_url, params={"stats": "gameLog", "season": season})
-                streak = 0
-                considered = 0
-                splits = []
-                for sp in glj.get("stats", []):
-                    splits = sp.get("splits", [])
-                    break
-                for s in splits:
-                    gd = s.get("date")
-                    if gd and gd > d:
-                        # ignore future log rows
-                        continue
-                    stat = s.get("stat", {}) or {}
-                    ab = stat.get("atBats", 0) or 0
-                    if ab <= 0:
-                        # only count games with an AB
-                        continue
-                    hits = stat.get("hits", 0) or 0
-                    considered += 1
-                    if hits == 0:
-                        streak += 1
-                    else:
-                        break
-                    if considered >= int(last_n):
-                        break
-
-                if streak < int(min_hitless_games):
-                    if debug:
-                        dbg.append({"name": full, "team": team_name, "skip": f"hitless_streak {streak} < min {int(min_hitless_games)}"})
-                    continue
+                    dbg.append({"warn": f"people batch fetch failed: {e}"})
 
-                items.append({
-                    "name": full,
-                    "team": team_name,
-                    "season_avg": round(avg, 3),
-                    "hitless_streak": streak
-                })
-            except Exception as e:
-                if debug:
-                    dbg.append({"name": full, "team": team_name, "error": f"game log fetch failed: {e}"})
-                continue
-
-        # Order and limit
-        items.sort(key=lambda x: (-x.get("hitless_streak", 0), -x.get("season_avg", 0.0), x.get("name", "")))
+        # 5) For each resolved player, compute filters and metrics; players missing from the
+        #    batch fall back to per-player calls, so run them on the pool (results keep input order)
+        def _row(info):
+            pid, tid, team_name, full = info
+            return self._cold_row(
+                pid, team_name, full, people.get(int(pid)), season, d,
+                min_season_avg, last_n, min_hitless_games,
+            )
+
+        with ThreadPoolExecutor(max_workers=max(1, min(_MAX_WORKERS, len(resolved)))) as pool:
+            for item, note in pool.map(_row, resolved):
+                if item is not None:
+                    items.append(item)
+                elif debug and note:
+                    dbg.append(note)
+
+        # Order and limit (top-k via heap when a positive limit is given)
+        order = lambda x: (-x.get("hitless_streak", 0), -x.get("season_avg", 0.0), x.get("name", ""))
         try:
             lim = int(limit)
-            if lim > 0:
-                items = items[:lim]
         except Exception:
-            pass
+            lim = 0
+        items = heapq.nsmallest(lim, items, key=order) if lim > 0 else sorted(items, key=order)
+        for it in items:
+            it["season_avg"] = round(it["season_avg"], 3)
 
         return {"date": d, "season": season, "items": items, "debug": dbg if debug else []}
+
+    def _cold_row(self, pid, team_name, full, person, season, d, min_season_avg, last_n, min_hitless_games):
+        """
+        Evaluate one resolved player. Returns (item, None) when the player qualifies,
+        otherwise (None, debug_note). Never raises, so one bad player can't abort the pool.
+        """
+        # Season average (anything the batch didn't carry comes back in ONE season,gameLog call)
+        try:
+            blocks = _stat_blocks(person)
+            if "season" not in blocks or "gameLog" not in blocks:
+                blocks = _stat_blocks(self.client.player_stats(
+                    pid, season, ["season", "gameLog"], group="hitting", fields=STATS_HITTING_FIELDS,
+                ))
+            avg = 0.0
+            for split in (blocks.get("season") or {}).get("splits") or []:
+                stat = split.get("stat") or {}
+                a = stat.get("avg")
+                if a is not None:
+                    try:
+                        avg = float(a)
+                    except Exception:
+                        pass
+            if avg < float(min_season_avg):
+                return None, {"name": full, "team": team_name, "skip": f"season_avg {avg:.3f} < min {float(min_season_avg):.3f}"}
+        except Exception as e:
+            return None, {"name": full, "team": team_name, "error": f"season stats fetch failed: {e}"}
+
+        # Hitless streak across recent AB>0 games
+        try:
+            streak = 0
+            considered = 0
+            for s in (blocks.get("gameLog") or {}).get("splits") or []:
+                gd = s.get("date")
+                if gd and gd > d:
+                    # ignore future log rows
+                    continue
+                stat = s.get("stat") or {}
+                ab = stat.get("atBats", 0) or 0
+                if ab <= 0:
+                    # only count games with an AB
+                    continue
+                hits = stat.get("hits", 0) or 0
+                considered += 1
+                if hits == 0:
+                    streak += 1
+                else:
+                    break
+                if considered >= int(last_n):
+                    break
+
+            if streak < int(min_hitless_games):
+                return None, {"name": full, "team": team_name, "skip": f"hitless_streak {streak} < min {int(min_hitless_games)}"}
+
+            return {
+                "name": full,
+                "team": team_name,
+                "season_avg": avg,  # rounded after top-k selection
+                "hitless_streak": streak
+            }, None
+        except Exception as e:
+            return None, {"name": full, "team": team_name, "error": f"game log fetch failed: {e}"}
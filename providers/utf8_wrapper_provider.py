@@ -6,9 +6,10 @@ from .statsapi_provider import StatsApiProvider
 from datetime import datetime
 import pytz
 
+_ET = pytz.timezone("America/New_York")
+
 def _tz_today_eastern():
-    tz = pytz.timezone("America/New_York")
-    return datetime.now(tz).date()
+    return datetime.now(_ET).date()
 
 def _parse_date(d):
     if d is None:
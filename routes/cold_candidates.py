@@ -2,13 +2,22 @@
 from __future__ import annotations
 
 from fastapi import APIRouter, Query, HTTPException
-from typing import Dict, List, Optional, Any, Tuple, Set
+from typing import Dict, Iterator, List, NamedTuple, Optional, Any, Tuple, Set
 from datetime import datetime, date as date_cls, timezone, timedelta
 import unicodedata
+import heapq
+from functools import lru_cache
+from concurrent.futures import ThreadPoolExecutor
 import httpx
 import pytz
 import math
 import statistics
+import threading
+import time
+
+from providers.statsapi_client import ROSTER_MIN_FIELDS, SCHEDULE_MIN_FIELDS
+from services.json_codec import loads as _json_loads
+from services.statsapi_json import dig as _dig, is_pitcher_entry as _is_pitcher_entry
 
 # --- Optional Statcast wiring ---
 _STATCAST_OK = False
@@ -22,6 +31,24 @@ except Exception:
 router = APIRouter()
 MLB_BASE = "https://statsapi.mlb.com/api/v1"
 _EASTERN = pytz.timezone("US/Eastern")
+# gameLog fetches in flight per league-scan wave
+_LOG_FETCH_WORKERS = 16
+# prospects fetched per still-open candidate slot; most prospects miss, so a wave overfetches a little
+_LOG_WAVE_PER_SLOT = 2
+# roster/people fetches in flight (fallback walks and batched id chunks)
+_ROSTER_FETCH_WORKERS = 8
+
+# one pooled keep-alive client for the process; a per-request client paid TCP+TLS setup on every call
+_HTTP = httpx.Client(
+    timeout=45,
+    limits=httpx.Limits(max_connections=64, max_keepalive_connections=32),
+)
+
+def _close_http_client() -> None:
+    _HTTP.close()
+
+# runs on app shutdown once this router is included
+router.add_event_handler("shutdown", _close_http_client)
 
 # ----------------- time & utils -----------------
 def _eastern_today_str() -> str:
@@ -39,10 +66,24 @@ def _parse_ymd(s: str) -> date_cls:
 def _next_ymd_str(s: str) -> str:
     return (_parse_ymd(s) + timedelta(days=1)).isoformat()
 
+def _to_int(v: Any) -> int:
+    """StatsAPI counters arrive as ints or digit strings; coerce without try/except (anything else -> 0)."""
+    if type(v) is int:
+        return v
+    if isinstance(v, str) and v.isdigit():
+        return int(v)
+    return 0
+
+@lru_cache(maxsize=4096)
 def _normalize(s: str) -> str:
+    if s.isascii():
+        # NFKD + ascii round-trip is the identity for ASCII input
+        return s.lower().strip()
     return unicodedata.normalize("NFKD", s).encode("ascii", "ignore").decode("ascii").lower().strip()
 
+@lru_cache(maxsize=4096)
 def _parse_dt_utc(maybe: Optional[str]) -> Optional[datetime]:
+    # memoized: gameLog splits repeat the same game timestamps across players/helpers
     if not maybe:
         return None
     s = str(maybe)
@@ -53,14 +94,56 @@ def _parse_dt_utc(maybe: Optional[str]) -> Optional[datetime]:
     except Exception:
         return None
 
-def _fetch_json(client: httpx.Client, url: str, params: Optional[Dict] = None) -> Dict:
+# request-level TTL cache shared by every /cold_candidates call in this process
+_RESP_TTL_SECONDS = 120.0
+_RESP_CACHE_MAX = 4096
+_resp_cache: Dict[str, Tuple[float, Dict]] = {}
+_resp_lock = threading.Lock()
+
+def _resp_key(url: str, params: Optional[Dict]) -> str:
+    return url + "?" + "&".join(f"{k}={v}" for k, v in sorted((params or {}).items()))
+
+def _resp_get(key: str) -> Optional[Any]:
+    rec = _resp_cache.get(key)
+    if rec is not None and (time.monotonic() - rec[0]) < _RESP_TTL_SECONDS:
+        return rec[1]
+    return None
+
+def _resp_put(key: str, data: Any) -> None:
+    now = time.monotonic()
+    with _resp_lock:
+        _resp_cache.pop(key, None)
+        _resp_cache[key] = (now, data)
+        # insertion order == age: expired entries sit at the front
+        while _resp_cache:
+            oldest = next(iter(_resp_cache))
+            if now - _resp_cache[oldest][0] < _RESP_TTL_SECONDS:
+                break
+            del _resp_cache[oldest]
+        if len(_resp_cache) > _RESP_CACHE_MAX:
+            # still over the cap with nothing expired: drop the oldest tenth
+            for k in list(_resp_cache)[: _RESP_CACHE_MAX // 10]:
+                _resp_cache.pop(k, None)
+
+def _fetch_json(client: httpx.Client, url: str, params: Optional[Dict] = None, cache: bool = True) -> Dict:
+    """GET + decode; replies are shared across requests when cached, so callers must not mutate them."""
+    key = _resp_key(url, params)
+    if cache:
+        hit = _resp_get(key)
+        if hit is not None:
+            return hit
     r = client.get(url, params=params)
     r.raise_for_status()
-    return r.json()
-
-def _fetch_json_safe(client: httpx.Client, url: str, params: Optional[Dict], dbg: Optional[List[Dict]], label: str) -> Dict:
+    data = _json_loads(r.content)
+    if cache:
+        _resp_put(key, data)
+    return data
+
+def _fetch_json_safe(
+    client: httpx.Client, url: str, params: Optional[Dict], dbg: Optional[List[Dict]], label: str, cache: bool = True
+) -> Dict:
     try:
-        return _fetch_json(client, url, params=params)
+        return _fetch_json(client, url, params=params, cache=cache)
     except Exception as e:
         if dbg is not None:
             dbg.append({"fetch_error": label, "error": f"{type(e).__name__}: {e}"})
@@ -68,71 +151,86 @@ def _fetch_json_safe(client: httpx.Client, url: str, params: Optional[Dict], dbg
 
 # ----------------- schedule helpers -----------------
 def _schedule_for_date(client: httpx.Client, date_str: str, dbg: Optional[List[Dict]]) -> Dict:
-    return _fetch_json_safe(client, f"{MLB_BASE}/schedule", {"sportId": 1, "date": date_str}, dbg, f"schedule:{date_str}")
+    return _fetch_json_safe(client, f"{MLB_BASE}/schedule", {"sportId": 1, "date": date_str, "fields": SCHEDULE_MIN_FIELDS}, dbg, f"schedule:{date_str}")
 
-def _not_started_team_ids_for_date(schedule_json: Dict) -> Set[int]:
-    """
-    STRICT pregame set: treat P=Preview, S=Scheduled, PW=Pre-Game Warmup as NOT started.
-    """
-    ns_ids: Set[int] = set()
-    for d in schedule_json.get("dates", []) or []:
-        for g in d.get("games", []) or []:
-            code = (g.get("status", {}) or {}).get("statusCode", "")
-            if code in ("P", "S", "PW"):
-                try:
-                    ns_ids.add(int(g["teams"]["home"]["team"]["id"]))
-                    ns_ids.add(int(g["teams"]["away"]["team"]["id"]))
-                except Exception:
-                    pass
-    return ns_ids
+def _schedule_range(client: httpx.Client, start_ymd: str, end_ymd: str, dbg: Optional[List[Dict]]) -> Dict:
+    return _fetch_json_safe(
+        client, f"{MLB_BASE}/schedule",
+        {"sportId": 1, "startDate": start_ymd, "endDate": end_ymd, "fields": SCHEDULE_MIN_FIELDS},
+        dbg, f"schedule:{start_ymd}..{end_ymd}"
+    )
 
-def _team_ids_from_schedule(schedule_json: Dict) -> List[int]:
-    ids: Set[int] = set()
+def _schedule_for_day(window_json: Dict, ymd: str) -> Dict:
+    """Slice one day out of a range schedule, shaped like a single-date reply ({} if the fetch failed)."""
+    if not window_json:
+        return {}
+    return {"dates": [d for d in window_json.get("dates", []) or [] if d.get("date") == ymd]}
+
+class _Slate(NamedTuple):
+    not_started_team_ids: Set[int]          # STRICT pregame: P=Preview, S=Scheduled, PW=Pre-Game Warmup
+    team_ids: List[int]                     # every team on the slate, sorted
+    game_pks: Set[int]
+    rows: List[Tuple[str, str, int, str]]   # (away@home, statusCode, gamePk, statusText) for the footer
+
+def _parse_slate(schedule_json: Dict) -> _Slate:
+    """One walk over a schedule reply for everything the route derives from it (re-run only on a roll)."""
+    not_started: Set[int] = set()
+    teams: Set[int] = set()
+    pks: Set[int] = set()
+    rows: List[Tuple[str, str, int, str]] = []
     for d in schedule_json.get("dates", []) or []:
         for g in d.get("games", []) or []:
+            tb = g.get("teams") or {}
+            home = _dig(tb, "home", "team") or {}
+            away = _dig(tb, "away", "team") or {}
+            st = g.get("status") or {}
+            code = st.get("statusCode", "")
+            side_ids = {int(t["id"]) for t in (away, home) if t.get("id") is not None}
+            teams |= side_ids
+            if code in ("P", "S", "PW"):
+                not_started |= side_ids
             try:
-                ids.add(int(g["teams"]["home"]["team"]["id"]))
-                ids.add(int(g["teams"]["away"]["team"]["id"]))
+                pk = int(g.get("gamePk") or 0)
             except Exception:
-                pass
-    return sorted(ids)
+                pk = 0
+            if pk:
+                pks.add(pk)
+            text = st.get("detailedState") or st.get("abstractGameState") or ""
+            rows.append((f"{away.get('name') or '?'} @ {home.get('name') or '?'}", code, pk, text))
+    return _Slate(not_started, sorted(teams), pks, rows)
 
-def _schedule_rows(schedule_json: Dict) -> List[Tuple[str,str,int,str]]:
+def _pregame_games_by_team(schedule_json: Dict) -> Dict[int, Dict[str, Any]]:
     """
-    Returns (away@home, statusCode, gamePk, statusText) for footer.
+    team_id -> first pregame (P/S/PW) game that team plays on the slate:
+    {"gamePk", "home_id", "away_id", "home_name"}. Built once per schedule.
     """
-    out: List[Tuple[str,str,int,str]] = []
+    out: Dict[int, Dict[str, Any]] = {}
     for d in schedule_json.get("dates", []) or []:
         for g in d.get("games", []) or []:
-            home = (((g.get("teams") or {}).get("home") or {}).get("team") or {}).get("name") or "?"
-            away = (((g.get("teams") or {}).get("away") or {}).get("team") or {}).get("name") or "?"
-            st = g.get("status", {}) or {}
-            code = st.get("statusCode", "")
-            text = st.get("detailedState") or st.get("abstractGameState") or ""
-            pk = g.get("gamePk") or 0
-            try: pk = int(pk)
-            except: pk = 0
-            out.append((f"{away} @ {home}", code, pk, text))
-    return out
-
-def _game_pks_for_date(schedule_json: Dict) -> Set[int]:
-    pks: Set[int] = set()
-    for d in schedule_json.get("dates", []) or []:
-        for g in d.get("games", []) or []:
-            pk = g.get("gamePk")
+            if (g.get("status") or {}).get("statusCode", "") not in ("P", "S", "PW"):
+                continue
+            tb = g.get("teams") or {}
+            home = _dig(tb, "home", "team") or {}
+            away = _dig(tb, "away", "team") or {}
             try:
-                if pk is not None:
-                    pks.add(int(pk))
+                row = {
+                    "gamePk": int(g.get("gamePk")),
+                    "home_id": int(home.get("id")),
+                    "away_id": int(away.get("id")),
+                    "home_name": home.get("name"),
+                }
             except Exception:
                 continue
-    return pks
+            out.setdefault(row["home_id"], row)
+            out.setdefault(row["away_id"], row)
+    return out
 
 def _probable_pitcher_for_team(game: Dict, team_side: str) -> Optional[Dict]:
     """
     team_side: 'home' or 'away'
     """
     try:
-        return ((game.get("teams") or {}).get(team_side) or {}).get("probablePitcher") or None
+        return _dig(game, "teams", team_side, "probablePitcher") or None
     except Exception:
         return None
 
@@ -147,19 +245,37 @@ def _all_mlb_team_ids(client: httpx.Client, season: int, dbg: Optional[List[Dict
             pass
     return sorted(out)
 
+def _build_game_meta(client: httpx.Client, schedule_json: Dict, dbg: Optional[List[Dict]]) -> Dict[int, Dict[str, Any]]:
+    """gamePk -> {"home_name", "probable"}; one live-feed fetch per game on the slate."""
+    game_meta: Dict[int, Dict[str, Any]] = {}
+    for d in schedule_json.get("dates", []) or []:
+        for g in d.get("games", []) or []:
+            pk = g.get("gamePk")
+            try:
+                pk = int(pk)
+            except Exception:
+                continue
+            home_team_name = _dig(g, "teams", "home", "team", "name")
+            try:
+                pp = _probable_pitcher_info(client, pk, dbg)
+            except Exception:
+                pp = {}
+            game_meta[pk] = {
+                "home_name": home_team_name,
+                "probable": pp
+            }
+    return game_meta
+
 # ----------------- stats & logs -----------------
 def _choose_best_mlb_season_split(splits: List[Dict]) -> Optional[Dict]:
     if not splits:
         return None
     def score(sp: Dict) -> Tuple[int, int]:
-        league_id = (((sp.get("league") or {}) or {}).get("id"))
-        sport_id = (((sp.get("sport") or {}) or {}).get("id"))
+        league_id = _dig(sp, "league", "id")
+        sport_id = _dig(sp, "sport", "id")
         if sport_id is None:
-            sport_id = (((sp.get("team") or {}).get("sport") or {}) or {}).get("id")
-        try:
-            ab = int((sp.get("stat") or {}).get("atBats") or 0)
-        except Exception:
-            ab = 0
+            sport_id = _dig(sp, "team", "sport", "id")
+        ab = _to_int((sp.get("stat") or {}).get("atBats"))
         pri = 2 if league_id in (103, 104) else (1 if sport_id == 1 else 0)
         return (pri, ab)
     best, key = None, (-1, -1)
@@ -170,47 +286,37 @@ def _choose_best_mlb_season_split(splits: List[Dict]) -> Optional[Dict]:
             best = sp
     return best
 
-def _season_avg_from_people_like(obj: Dict) -> Optional[float]:
-    stats = (obj.get("stats") or [])
-    for block in stats:
-        gdn = (block.get("group") or {}).get("displayName", "")
-        gcd = (block.get("group") or {}).get("code", "")
-        tdn = (block.get("type") or {}).get("displayName", "")
-        tcd = (block.get("type") or {}).get("code", "")
-        if (gdn == "hitting" or gcd == "hitting") and (tdn.lower() == "season" or tcd == "season"):
-            splits = block.get("splits") or []
-            chosen = _choose_best_mlb_season_split(splits)
-            if not chosen:
-                continue
-            try:
-                return float(str((chosen.get("stat") or {}).get("avg")))
-            except Exception:
-                return None
+def _season_hitting_stat(obj: Dict) -> Optional[Dict]:
+    """`stat` of the best MLB split in the hitting/season block (one scan shared by the readers below)."""
+    for block in obj.get("stats") or []:
+        grp = block.get("group") or {}
+        typ = block.get("type") or {}
+        # StatsAPI sends these lowercase/camelCase verbatim; compare without .lower()
+        if (grp.get("displayName") == "hitting" or grp.get("code") == "hitting") and \
+                (typ.get("displayName") == "season" or typ.get("code") == "season"):
+            chosen = _choose_best_mlb_season_split(block.get("splits") or [])
+            if chosen:
+                return chosen.get("stat") or {}
     return None
 
+def _season_avg_from_stat(st: Optional[Dict]) -> Optional[float]:
+    if st is None:
+        return None
+    try:
+        return float(str(st.get("avg")))
+    except Exception:
+        return None
+
+def _season_ab_gp_from_stat(st: Optional[Dict]) -> Tuple[Optional[int], Optional[int]]:
+    if st is None:
+        return None, None
+    return _to_int(st.get("atBats")), _to_int(st.get("gamesPlayed") or st.get("games"))
+
+def _season_avg_from_people_like(obj: Dict) -> Optional[float]:
+    return _season_avg_from_stat(_season_hitting_stat(obj))
+
 def _season_ab_gp_from_people_like(obj: Dict) -> Tuple[Optional[int], Optional[int]]:
-    stats = (obj.get("stats") or [])
-    for block in stats:
-        gdn = (block.get("group") or {}).get("displayName", "")
-        gcd = (block.get("group") or {}).get("code", "")
-        tdn = (block.get("type") or {}).get("displayName", "")
-        tcd = (block.get("type") or {}).get("code", "")
-        if (gdn == "hitting" or gcd == "hitting") and (tdn.lower() == "season" or tcd == "season"):
-            splits = block.get("splits") or []
-            chosen = _choose_best_mlb_season_split(splits)
-            if not chosen:
-                continue
-            st = chosen.get("stat") or {}
-            try:
-                ab = int(st.get("atBats") or 0)
-            except Exception:
-                ab = None
-            try:
-                gp = int(st.get("gamesPlayed") or st.get("games") or 0)
-            except Exception:
-                gp = None
-            return ab, gp
-    return None, None
+    return _season_ab_gp_from_stat(_season_hitting_stat(obj))
 
 def _expected_abs_from_person(obj: Dict) -> float:
     ab, gp = _season_ab_gp_from_people_like(obj)
@@ -234,7 +340,16 @@ def _game_log_regular_season_desc(client: httpx.Client, pid: int, season: int, m
         dbg, f"gameLog:{pid}:{season}"
     )
     splits = ((data.get("stats") or [{}])[0].get("splits")) or []
+    return _regular_season_desc(splits, max_entries)
+
+def _hydrated_game_log(person: Dict) -> Optional[List[Dict]]:
+    """gameLog splits from a person hydrated with stats(type=[...,gameLog]); None if that block is absent."""
+    for block in person.get("stats") or []:
+        if (block.get("type") or {}).get("displayName") == "gameLog":
+            return block.get("splits") or []
+    return None
 
+def _regular_season_desc(splits: List[Dict], max_entries: int) -> List[Dict]:
     def is_regular(s: Dict) -> bool:
         gt = s.get("gameType")
         return (gt is None) or (gt == "R")
@@ -242,7 +357,7 @@ def _game_log_regular_season_desc(client: httpx.Client, pid: int, season: int, m
     def sort_key(s: Dict[str, Any]) -> tuple:
         dt = _parse_dt_utc(s.get("gameDate") or s.get("date"))
         ts = dt.timestamp() if dt else -1.0
-        pk = s.get("game", {}).get("gamePk") or s.get("gamePk") or 0
+        pk = _dig(s, "game", "gamePk") or s.get("gamePk") or 0
         try:
             pk = int(pk)
         except Exception:
@@ -256,6 +371,12 @@ def _game_log_regular_season_desc(client: httpx.Client, pid: int, season: int, m
 def _date_in_eastern(dt_utc: datetime) -> date_cls:
     return dt_utc.astimezone(_EASTERN).date()
 
+@lru_cache(maxsize=4096)
+def _eastern_date_of(maybe: Optional[str]) -> Optional[date_cls]:
+    """gameDate/date string -> ET calendar date (None if unparseable), cached per distinct string."""
+    dt_utc = _parse_dt_utc(maybe)
+    return _date_in_eastern(dt_utc) if dt_utc else None
+
 def _extract_team_name_from_person_or_logs(
     person_like: Dict,
     team_map: Optional[Dict[int, Tuple[int, str]]] = None,
@@ -274,10 +395,8 @@ def _extract_team_name_from_person_or_logs(
     if logs and slate_date_ymd:
         slate_date = _parse_ymd(slate_date_ymd)
         for s in logs:
-            dt_utc = _parse_dt_utc(s.get("gameDate") or s.get("date"))
-            if not dt_utc:
-                continue
-            if _date_in_eastern(dt_utc) >= slate_date:
+            et_day = _eastern_date_of(s.get("gameDate") or s.get("date"))
+            if not et_day or et_day >= slate_date:
                 continue
             t = (s.get("team") or {})
             nm = (t.get("name") or "").strip()
@@ -287,91 +406,69 @@ def _extract_team_name_from_person_or_logs(
         return (team_map[pid][1] or "").strip() or "N/A"
     return "N/A"
 
-def _current_hitless_streak_before_slate(
+def _iter_prior_hits(
     game_splits: List[Dict],
     slate_date_ymd: str,
     exclude_game_pks: Optional[Set[int]] = None
-) -> int:
+) -> Iterator[int]:
+    """
+    Hits for each game before the slate with AB>0 (excluded gamePks skipped), newest first.
+    The single place splits are parsed; lazy so callers can stop early.
+    """
     slate_date = _parse_ymd(slate_date_ymd)
     exclude_game_pks = exclude_game_pks or set()
-    streak = 0
     for s in game_splits:
-        pk = s.get("game", {}).get("gamePk") or s.get("gamePk")
+        pk = _dig(s, "game", "gamePk") or s.get("gamePk")
         try:
             if pk is not None and int(pk) in exclude_game_pks:
                 continue
         except Exception:
             pass
 
-        dt_utc = _parse_dt_utc(s.get("gameDate") or s.get("date"))
-        if not dt_utc:
-            continue
-        if _date_in_eastern(dt_utc) >= slate_date:
-            continue  # exclude same-day/future
+        et_day = _eastern_date_of(s.get("gameDate") or s.get("date"))
+        if not et_day or et_day >= slate_date:
+            continue  # unparseable, or same-day/future
 
         stat = s.get("stat") or {}
-        try:
-            ab = int(stat.get("atBats") or 0)
-            hits = int(stat.get("hits") or 0)
-        except Exception:
-            ab, hits = 0, 0
-        if ab <= 0:
+        if _to_int(stat.get("atBats")) <= 0:
             continue
-        if hits == 0:
-            streak += 1
-        else:
-            break
-    return streak
+        yield _to_int(stat.get("hits"))
 
-def _average_hitless_streak_before_slate(
+def _hitless_profile(
     game_splits: List[Dict],
     slate_date_ymd: str,
     exclude_game_pks: Optional[Set[int]] = None
-) -> Optional[float]:
-    slate_date = _parse_ymd(slate_date_ymd)
-    exclude_game_pks = exclude_game_pks or set()
-
-    prior: List[Dict] = []
-    for s in game_splits:
-        pk = s.get("game", {}).get("gamePk") or s.get("gamePk")
-        try:
-            if pk is not None and int(pk) in exclude_game_pks:
-                continue
-        except Exception:
-            pass
-
-        dt_utc = _parse_dt_utc(s.get("gameDate") or s.get("date"))
-        if not dt_utc:
-            continue
-        if _date_in_eastern(dt_utc) >= slate_date:
-            continue
-        stat = s.get("stat") or {}
-        try:
-            ab = int(stat.get("atBats") or 0)
-        except Exception:
-            ab = 0
-        if ab > 0:
-            prior.append(s)
-    prior.reverse()  # oldest -> newest
-
-    streaks: List[int] = []
-    run = 0
-    for s in prior:
-        stat = s.get("stat") or {}
-        try:
-            hits = int(stat.get("hits") or 0)
-        except Exception:
-            hits = 0
+) -> Tuple[int, Optional[float]]:
+    """
+    (current hitless streak, average completed hitless run) from one pass over the splits.
+    A run only counts toward the average once a later game with a hit has closed it, so the
+    current (still open) streak -- the run before the first hit seen newest-first -- is excluded.
+    """
+    streak = total = count = run = 0
+    seen_hit = False
+    for hits in _iter_prior_hits(game_splits, slate_date_ymd, exclude_game_pks):
         if hits == 0:
             run += 1
-        else:
-            if run > 0:
-                streaks.append(run)
-                run = 0
-
-    if not streaks:
-        return None
-    return sum(streaks) / len(streaks)
+            continue
+        if not seen_hit:
+            streak = run
+        elif run > 0:
+            total += run
+            count += 1
+        run = 0
+        seen_hit = True
+    if not seen_hit:
+        streak = run
+    elif run > 0:
+        total += run
+        count += 1
+    return streak, (total / count if count else None)
+
+class _Prospect(NamedTuple):
+    """League-scan row awaiting its gameLog check (no per-row dict)."""
+    season_avg: float
+    pid: int
+    person: Dict
 
 # ----------------- roster collection -----------------
 def _team_roster_ids_multi(client: httpx.Client, team_id: int, season: int, dbg: Optional[List[Dict]]) -> List[int]:
@@ -385,10 +482,13 @@ def _team_roster_ids_multi(client: httpx.Client, team_id: int, season: int, dbg:
     ids: List[int] = []
     for label, params in attempts:
         try:
-            data = _fetch_json(client, f"{MLB_BASE}/teams/{team_id}/roster", params=params)
+            data = _fetch_json(client, f"{MLB_BASE}/teams/{team_id}/roster", params={**params, "fields": ROSTER_MIN_FIELDS})
             roster = data.get("roster", []) or []
             got = 0
             for r in roster:
+                if _is_pitcher_entry(r):
+                    got += 1  # roster resolved; pitcher just isn't a candidate
+                    continue
                 person = r.get("person") or {}
                 pid = person.get("id")
                 try:
@@ -406,11 +506,18 @@ def _team_roster_ids_multi(client: httpx.Client, team_id: int, season: int, dbg:
             continue
     return ids
 
+def _fetch_chunks(fetch, chunks: List[List[int]]) -> List[Any]:
+    """Run one blocking fetch per id chunk side by side; results come back in chunk order."""
+    if len(chunks) <= 1:
+        return [fetch(c) for c in chunks]
+    with ThreadPoolExecutor(max_workers=min(_ROSTER_FETCH_WORKERS, len(chunks))) as pool:
+        return list(pool.map(fetch, chunks))
+
 def _hydrate_team_roster_people(client: httpx.Client, team_ids: List[int], season: int, dbg: Optional[List[Dict]]) -> Tuple[Set[int], Dict[int, Tuple[int, str]]]:
     person_ids: Set[int] = set()
     team_map: Dict[int, Tuple[int, str]] = {}
-    for i in range(0, len(team_ids), 8):
-        sub = team_ids[i:i+8]
+
+    def _fetch(sub: List[int]) -> Optional[Dict]:
         params = {
             "teamIds": ",".join(str(t) for t in sub),
             "sportId": 1,
@@ -418,26 +525,34 @@ def _hydrate_team_roster_people(client: httpx.Client, team_ids: List[int], seaso
             "hydrate": f"roster(person,person.stats(group=hitting,type=season,season={season}))"
         }
         try:
-            data = _fetch_json(client, f"{MLB_BASE}/teams", params=params)
-            for t in data.get("teams", []) or []:
-                tid = t.get("id")
-                tname = t.get("name", "")
-                roster_container = t.get("roster")
-                entries = (roster_container.get("roster", []) if isinstance(roster_container, dict) else roster_container) or []
-                for entry in entries:
-                    person = entry.get("person") or {}
-                    pid = person.get("id")
-                    if pid is None:
-                        continue
-                    try:
-                        pid = int(pid)
-                    except Exception:
-                        continue
-                    person_ids.add(pid)
-                    team_map[pid] = (int(tid) if tid is not None else None, tname)
+            return _fetch_json(client, f"{MLB_BASE}/teams", params=params)
         except Exception as e:
             if dbg is not None:
                 dbg.append({"teams_hydrate_chunk": sub, "error": f"{type(e).__name__}: {e}"})
+            return None
+
+    chunks = [team_ids[i:i+8] for i in range(0, len(team_ids), 8)]
+    for data in _fetch_chunks(_fetch, chunks):
+        if data is None:
+            continue
+        for t in data.get("teams", []) or []:
+            tid = t.get("id")
+            tname = t.get("name", "")
+            roster_container = t.get("roster")
+            entries = (roster_container.get("roster", []) if isinstance(roster_container, dict) else roster_container) or []
+            for entry in entries:
+                if _is_pitcher_entry(entry):
+                    continue
+                person = entry.get("person") or {}
+                pid = person.get("id")
+                if pid is None:
+                    continue
+                try:
+                    pid = int(pid)
+                except Exception:
+                    continue
+                person_ids.add(pid)
+                team_map[pid] = (int(tid) if tid is not None else None, tname)
     return person_ids, team_map
 
 def _collect_union_player_ids(
@@ -446,20 +561,23 @@ def _collect_union_player_ids(
     season: int,
     dbg: Optional[List[Dict]]
 ) -> Tuple[List[int], Dict[int, Tuple[int, str]]]:
-    ids: Set[int] = set()
-    team_map: Dict[int, Tuple[int, str]] = {}
-
-    for tid in team_ids:
-        got = _team_roster_ids_multi(client, tid, season, dbg)
-        for pid in got:
-            ids.add(pid)
-            team_map.setdefault(pid, (tid, ""))
+    # hydrated /teams covers 8 rosters per call; the per-team roster walk (up to 5
+    # requests per team) only runs for teams the hydrate left unresolved
+    hydrate_ids, team_map = _hydrate_team_roster_people(client, team_ids, season, dbg)
+    ids: Set[int] = set(hydrate_ids)
+    resolved_teams = {tid for tid, _ in team_map.values()}
+    pending = [tid for tid in team_ids if tid not in resolved_teams]
+    if dbg is not None:
+        dbg.append({"roster_fallback_teams": pending})
 
-    hydrate_ids, hydrate_map = _hydrate_team_roster_people(client, team_ids, season, dbg)
-    for pid in hydrate_ids:
-        ids.add(pid)
-        if pid in hydrate_map:
-            team_map[pid] = hydrate_map[pid]
+    if pending:
+        # each fallback walk is a chain of blocking roster GETs; run the teams side by side
+        with ThreadPoolExecutor(max_workers=min(_ROSTER_FETCH_WORKERS, len(pending))) as pool:
+            rosters = list(pool.map(lambda tid: _team_roster_ids_multi(client, tid, season, dbg), pending))
+        for tid, got in zip(pending, rosters):
+            for pid in got:
+                ids.add(pid)
+                team_map.setdefault(pid, (tid, ""))
 
     out_ids = sorted(ids)
     if dbg is not None:
@@ -467,9 +585,7 @@ def _collect_union_player_ids(
     return out_ids, team_map
 
 def _batch_people_with_stats(client: httpx.Client, ids: List[int], season: int, dbg: Optional[List[Dict]]) -> List[Dict]:
-    out: List[Dict] = []
-    for i in range(0, len(ids), 100):
-        sub = ids[i:i+100]
+    def _fetch(sub: List[int]) -> List[Dict]:
         try:
             params = {
                 "personIds": ",".join(str(x) for x in sub),
@@ -477,12 +593,17 @@ def _batch_people_with_stats(client: httpx.Client, ids: List[int], season: int,
             }
             data = _fetch_json(client, f"{MLB_BASE}/people", params=params)
             ppl = data.get("people", []) or []
-            out.extend(ppl)
             if dbg is not None:
                 dbg.append({"people_batch_chunk": len(sub), "returned": len(ppl)})
+            return ppl
         except Exception as e:
             if dbg is not None:
                 dbg.append({"people_batch_chunk": len(sub), "error": f"{type(e).__name__}: {e}"})
+            return []
+
+    out: List[Dict] = []
+    for ppl in _fetch_chunks(_fetch, [ids[i:i+100] for i in range(0, len(ids), 100)]):
+        out.extend(ppl)
     return out
 
 # ----------------- Statcast enrichment -----------------
@@ -611,8 +732,13 @@ def _park_factor_for_matchup(home_name: Optional[str]) -> float:
     return float(_PARK_FACTOR_HITS.get(home_name, 100))
 
 def _probable_pitcher_info(client: httpx.Client, gamePk: int, dbg: Optional[List[Dict]]) -> Dict:
-    game = _fetch_json_safe(client, f"{MLB_BASE}/game/{gamePk}/feed/live", None, dbg, f"live:{gamePk}")
-    allp = (((game.get("gameData") or {}).get("probablePitchers")) or {})
+    # live feeds run to megabytes; cache only the extracted probables, never the feed itself
+    cache_key = f"probable:{gamePk}"
+    hit = _resp_get(cache_key)
+    if hit is not None:
+        return hit
+    game = _fetch_json_safe(client, f"{MLB_BASE}/game/{gamePk}/feed/live", None, dbg, f"live:{gamePk}", cache=False)
+    allp = _dig(game, "gameData", "probablePitchers", default={})
     # structure: {"home": {...}, "away": {...}}
     out = {}
     for side in ("home", "away"):
@@ -626,13 +752,13 @@ def _probable_pitcher_info(client: httpx.Client, gamePk: int, dbg: Optional[List
     try:
         box = (game.get("liveData") or {}).get("boxscore") or {}
         for side in ("home", "away"):
-            pmap = ((box.get("teams") or {}).get(side) or {}).get("players") or {}
+            pmap = _dig(box, "teams", side, "players") or {}
             pid = out[side].get("id")
             if pid is None: 
                 continue
             key = f"ID{pid}"
             if key in pmap:
-                stats = ((pmap[key] or {}).get("seasonStats") or {}).get("pitching") or {}
+                stats = _dig(pmap[key], "seasonStats", "pitching") or {}
                 era = stats.get("era")
                 try:
                     out[side]["era"] = float(era) if era is not None else None
@@ -640,6 +766,8 @@ def _probable_pitcher_info(client: httpx.Client, gamePk: int, dbg: Optional[List
                     out[side]["era"] = None
     except Exception:
         pass
+    if game:
+        _resp_put(cache_key, out)
     return out
 
 def _platoon_bonus(h_bats: Optional[str], p_hand: Optional[str]) -> float:
@@ -754,7 +882,7 @@ def _parse_sort_by(sort_by: Optional[str]) -> List[Tuple[str, bool]]:
             out.append((field, desc))
     return out or default
 
-def _apply_sort(candidates: List[Dict], sort_spec: List[Tuple[str, bool]]) -> List[Dict]:
+def _apply_sort(candidates: List[Dict], sort_spec: List[Tuple[str, bool]], limit: Optional[int] = None) -> List[Dict]:
     def key_fn(item: Dict):
         keys = []
         for field, desc in sort_spec:
@@ -765,6 +893,9 @@ def _apply_sort(candidates: List[Dict], sort_spec: List[Tuple[str, bool]]) -> Li
                 v = 0.0
             keys.append(-v if desc else v)
         return tuple(keys)
+    if limit is not None:
+        # top-k only; same order as sorted(...)[:limit]
+        return heapq.nsmallest(max(0, int(limit)), candidates, key=key_fn)
     return sorted(candidates, key=key_fn)
 
 # ----------------- main route -----------------
@@ -861,343 +992,359 @@ def cold_candidates(
     group_mode = (group_by or "").strip().lower()
     sort_spec = _parse_sort_by(sort_by) if group_mode == "none" else []
 
-    with httpx.Client(timeout=45) as client:
-        debug_list: Optional[List[Dict]] = [] if debug else None
+    client = _HTTP
+    debug_list: Optional[List[Dict]] = [] if debug else None
 
-        # schedule for date
+    # schedule for date; when a roll to the next slate is possible, one range call covers both days
+    next_sched: Optional[Dict] = None
+    if (verify_effective == 1) and roll_enabled:
+        next_date = _next_ymd_str(effective_date)
+        window = _schedule_range(client, effective_date, next_date, debug_list)
+        sched = _schedule_for_day(window, effective_date)
+        next_sched = _schedule_for_day(window, next_date)
+    else:
         sched = _schedule_for_date(client, effective_date, debug_list)
-        ns_team_ids_today = _not_started_team_ids_for_date(sched) if (verify_effective == 1) else set()
-        slate_team_ids_today = _team_ids_from_schedule(sched) if sched else _all_mlb_team_ids(client, season, debug_list)
-        exclude_pks_for_date = _game_pks_for_date(sched) if sched else set()
-        sched_rows = _schedule_rows(sched)
-
-        # build map: gamePk -> probable pitchers, home name
-        game_meta: Dict[int, Dict[str, Any]] = {}
-        for d in sched.get("dates", []) or []:
-            for g in d.get("games", []) or []:
-                pk = g.get("gamePk")
-                try:
-                    pk = int(pk)
-                except Exception:
-                    continue
-                home_team_name = (((g.get("teams") or {}).get("home") or {}).get("team") or {}).get("name")
-                try:
-                    pp = _probable_pitcher_info(client, pk, debug_list)
-                except Exception:
-                    pp = {}
-                game_meta[pk] = {
-                    "home_name": home_team_name,
-                    "probable": pp
-                }
-
-        rolled = False
-        if (verify_effective == 1) and roll_enabled and len(ns_team_ids_today) == 0:
-            effective_date = _next_ymd_str(effective_date)
-            sched = _schedule_for_date(client, effective_date, debug_list)
-            ns_team_ids_today = _not_started_team_ids_for_date(sched)
-            slate_team_ids_today = _team_ids_from_schedule(sched) or slate_team_ids_today
-            exclude_pks_for_date = _game_pks_for_date(sched)
-            sched_rows = _schedule_rows(sched)
-            # refresh game meta
-            game_meta = {}
-            for d in sched.get("dates", []) or []:
-                for g in d.get("games", []) or []:
-                    pk = g.get("gamePk")
-                    try:
-                        pk = int(pk)
-                    except Exception:
-                        continue
-                    home_team_name = (((g.get("teams") or {}).get("home") or {}).get("team") or {}).get("name")
-                    try:
-                        pp = _probable_pitcher_info(client, pk, debug_list)
-                    except Exception:
-                        pp = {}
-                    game_meta[pk] = {
-                        "home_name": home_team_name,
-                        "probable": pp
-                    }
-            rolled = True
-
-        # gather people
-        candidates: List[Dict] = []
-
-        def _qualify_by_ab_gp(person_like: Dict) -> bool:
-            ab, gp = _season_ab_gp_from_people_like(person_like)
-            if ab is None or gp is None:
-                return False
-            return (ab >= min_season_ab) and (gp >= min_season_gp)
-
-        def _decor_context(pid: int, person: Dict, target_date: str, logs: List[Dict]) -> Dict[str, Any]:
-            """
-            Determine opponent SP ERA (best effort), platoon, park index.
-            """
-            bats_code = (((person.get("batSide") or {}).get("code")) or ((person.get("batSide") or {}).get("batSideCode")) or (person.get("batSideCode"))) or None
-            # pick the most recent prior game (before slate) to infer the scheduled gamePk; if none, context will be best effort neutral
-            opp_sp_era = None
-            platoon_adv = False
-            park_idx = 100.0
-
-            # Attempt to find today's game pk by scanning schedule team ids mapping
-            # If logs include the game after slate (none), fallback to probable pitchers by team matchup
-            # Best-effort: iterate schedule rows and find a game where player's current team matches and status is pregame.
-            # To know player's team id:
-            team_info = person.get("currentTeam") or {}
-            tid = team_info.get("id")
-            # Find any game with this team id
-            target_gpk = None
-            for d in sched.get("dates", []) or []:
-                for g in d.get("games", []) or []:
-                    try:
-                        home_id = int(((g.get("teams") or {}).get("home") or {}).get("team", {}).get("id"))
-                        away_id = int(((g.get("teams") or {}).get("away") or {}).get("team", {}).get("id"))
-                        if tid is not None and int(tid) in (home_id, away_id):
-                            # Check status pregame-like
-                            code = (g.get("status", {}) or {}).get("statusCode", "")
-                            if code in ("P", "S", "PW"):
-                                target_gpk = int(g.get("gamePk"))
-                                home_name = (((g.get("teams") or {}).get("home") or {}).get("team") or {}).get("name")
-                                park_idx = _park_factor_for_matchup(home_name)
-                                # determine opposing pitcher hand/era
-                                pp = game_meta.get(target_gpk, {}).get("probable") or {}
-                                # if player's team is away, opposing is home probable; vice versa
-                                opp_side = "home" if int(tid) == away_id else "away"
-                                opp = pp.get(opp_side) or {}
-                                p_hand = opp.get("pitchHand")  # 'R' or 'L'
-                                era = opp.get("era")
-                                opp_sp_era = era if isinstance(era, (int, float)) else None
-                                # platoon
-                                platoon_adv = bool(_platoon_bonus(bats_code, p_hand))
-                                raise StopIteration
-                    except Exception:
-                        continue
-            # If none found, leave neutrals (will not sink scoring)
-            return {
-                "opp_sp_era": opp_sp_era,                # None allowed
-                "platoon_advantage": platoon_adv,        # bool
-                "park_index_hits": park_idx              # float index
-            }
+    slate = _parse_slate(sched)
+    ns_team_ids_today = slate.not_started_team_ids if (verify_effective == 1) else set()
+    slate_team_ids_today = slate.team_ids if sched else _all_mlb_team_ids(client, season, debug_list)
+    exclude_pks_for_date = slate.game_pks
+    sched_rows = slate.rows
+
+    rolled = False
+    if (verify_effective == 1) and roll_enabled and len(ns_team_ids_today) == 0:
+        effective_date = _next_ymd_str(effective_date)
+        sched = next_sched if next_sched is not None else _schedule_for_date(client, effective_date, debug_list)
+        slate = _parse_slate(sched)
+        ns_team_ids_today = slate.not_started_team_ids
+        slate_team_ids_today = slate.team_ids or slate_team_ids_today
+        exclude_pks_for_date = slate.game_pks
+        sched_rows = slate.rows
+        rolled = True
+
+    # gamePk -> probable pitchers, home name; built once for the final slate
+    game_meta = _build_game_meta(client, sched, debug_list)
+
+    # team id -> today's pregame game, so per-candidate context is a dict lookup
+    pregame_by_team = _pregame_games_by_team(sched)
+
+    # gather people
+    candidates: List[Dict] = []
+
+    def _qualify_by_ab_gp(person_like: Dict) -> bool:
+        ab, gp = _season_ab_gp_from_people_like(person_like)
+        if ab is None or gp is None:
+            return False
+        return (ab >= min_season_ab) and (gp >= min_season_gp)
+
+    def _decor_context(pid: int, person: Dict, target_date: str, logs: List[Dict]) -> Dict[str, Any]:
+        """
+        Determine opponent SP ERA (best effort), platoon, park index.
+        """
+        bats_code = _dig(person, "batSide", "code") or _dig(person, "batSide", "batSideCode") or person.get("batSideCode") or None
+        # pick the most recent prior game (before slate) to infer the scheduled gamePk; if none, context will be best effort neutral
+        opp_sp_era = None
+        platoon_adv = False
+        park_idx = 100.0
+
+        # Find the player's pregame game on the slate via their current team id.
+        team_info = person.get("currentTeam") or {}
+        try:
+            tid = int(team_info.get("id"))
+        except Exception:
+            tid = None
+        game = pregame_by_team.get(tid) if tid is not None else None
+        if game:
+            park_idx = _park_factor_for_matchup(game["home_name"])
+            # determine opposing pitcher hand/era
+            pp = game_meta.get(game["gamePk"], {}).get("probable") or {}
+            # if player's team is away, opposing is home probable; vice versa
+            opp_side = "home" if tid == game["away_id"] else "away"
+            opp = pp.get(opp_side) or {}
+            p_hand = opp.get("pitchHand")  # 'R' or 'L'
+            era = opp.get("era")
+            opp_sp_era = era if isinstance(era, (int, float)) else None
+            # platoon
+            platoon_adv = bool(_platoon_bonus(bats_code, p_hand))
+        # If none found, leave neutrals (will not sink scoring)
+        return {
+            "opp_sp_era": opp_sp_era,                # None allowed
+            "platoon_advantage": platoon_adv,        # bool
+            "park_index_hits": park_idx              # float index
+        }
 
-        def _decorate_and_add(person: Dict, pid: int, target_date: str, team_map: Optional[Dict[int, Tuple[int, str]]] = None):
-            logs = _game_log_regular_season_desc(client, pid, season, max_entries=160, dbg=debug_list)
-            streak = _current_hitless_streak_before_slate(logs, target_date, exclude_pks_for_date)
-            if streak < min_hitless_games:
-                return
-            avg_season_hitless = _average_hitless_streak_before_slate(logs, target_date, exclude_pks_for_date)
-            team_name = _extract_team_name_from_person_or_logs(person, team_map, pid, logs, target_date)
-            season_avg = _season_avg_from_people_like(person)
-            if season_avg is None or season_avg < min_season_avg:
-                return
-
-            cand = {
-                "name": person.get("fullName") or "",
-                "team": team_name,
-                "season_avg": round(float(season_avg), 3),
-                "hitless_streak": int(streak),
-                "avg_hitless_streak_season": round(avg_season_hitless, 2) if avg_season_hitless is not None else 0.0,
-            }
-            _decorate_candidate_with_base_scores(cand, person)
-
-            # Statcast overlay fetch + signal
-            stat = _get_statcast_recent(pid, target_date, hh_recent_days, debug_list)
-            has_sig, why = _statcast_signal(stat, statcast_min_hh_14d, statcast_min_xba_delta_14d)
-
-            # Context (pitcher/park/platoon)
-            ctx = _decor_context(pid, person, target_date, logs)
-
-            # Composite with context
-            composite = _compose_composite(
-                cand, stat, ctx,
-                w_hit_chance, w_overdue, w_elite_avg, w_statcast,
-                w_pitcher, w_platoon, w_park
-            )
-
-            cand["score_plus"] = round(float(cand["score"]), 1)  # placeholder = score; keep until you wire markets
-            cand["composite"] = round(composite, 1)
-            cand["_statcast"] = {
-                "has_signal": has_sig,
-                "why": why,
-                "hh_percent_14d": stat.get("hh_percent_14d"),
-                "xba_delta_14d": stat.get("xba_delta_14d"),
-                "wired": stat.get("wired", False)
-            }
-            # Add lightweight context echoes (helps debugging & ranking interpretability)
-            cand["_context"] = {
-                "opp_sp_era": ctx.get("opp_sp_era"),
-                "platoon_adv": ctx.get("platoon_advantage"),
-                "park_idx_hits": ctx.get("park_index_hits")
-            }
-            candidates.append(cand)
+    def _fetch_logs(pid: int) -> List[Dict]:
+        return _game_log_regular_season_desc(client, pid, season, max_entries=160, dbg=debug_list)
+
+    def _decorate_and_add(
+        person: Dict,
+        pid: int,
+        target_date: str,
+        team_map: Optional[Dict[int, Tuple[int, str]]] = None,
+        logs: Optional[List[Dict]] = None,
+    ):
+        # season average comes from the already-hydrated person: reject before paying for a gameLog
+        season_avg = _season_avg_from_people_like(person)
+        if season_avg is None or season_avg < min_season_avg:
+            return
+        if logs is None:
+            logs = _fetch_logs(pid)
+        streak, avg_season_hitless = _hitless_profile(logs, target_date, exclude_pks_for_date)
+        if streak < min_hitless_games:
+            return
+        team_name = _extract_team_name_from_person_or_logs(person, team_map, pid, logs, target_date)
+
+        cand = {
+            "name": person.get("fullName") or "",
+            "team": team_name,
+            "season_avg": round(float(season_avg), 3),
+            "hitless_streak": int(streak),
+            "avg_hitless_streak_season": round(avg_season_hitless, 2) if avg_season_hitless is not None else 0.0,
+        }
+        _decorate_candidate_with_base_scores(cand, person)
+
+        # Statcast overlay fetch + signal
+        stat = _get_statcast_recent(pid, target_date, hh_recent_days, debug_list)
+        has_sig, why = _statcast_signal(stat, statcast_min_hh_14d, statcast_min_xba_delta_14d)
+
+        # Context (pitcher/park/platoon)
+        ctx = _decor_context(pid, person, target_date, logs)
+
+        # Composite with context
+        composite = _compose_composite(
+            cand, stat, ctx,
+            w_hit_chance, w_overdue, w_elite_avg, w_statcast,
+            w_pitcher, w_platoon, w_park
+        )
+
+        cand["score_plus"] = round(float(cand["score"]), 1)  # placeholder = score; keep until you wire markets
+        cand["composite"] = round(composite, 1)
+        cand["_statcast"] = {
+            "has_signal": has_sig,
+            "why": why,
+            "hh_percent_14d": stat.get("hh_percent_14d"),
+            "xba_delta_14d": stat.get("xba_delta_14d"),
+            "wired": stat.get("wired", False)
+        }
+        # Add lightweight context echoes (helps debugging & ranking interpretability)
+        cand["_context"] = {
+            "opp_sp_era": ctx.get("opp_sp_era"),
+            "platoon_adv": ctx.get("platoon_advantage"),
+            "park_idx_hits": ctx.get("park_index_hits")
+        }
+        candidates.append(cand)
 
-        # league mode or explicit names
-        if names:
-            requested = [n.strip() for n in names.split(",") if n.strip()]
-            for name in requested:
-                try:
-                    data = _fetch_json(client, f"{MLB_BASE}/people/search", params={"names": name})
-                    people = data.get("people", []) or []
-                    if not people:
-                        if debug_list is not None:
-                            debug_list.append({"name": name, "skip": "player not found"})
-                        continue
-                    norm_target = _normalize(name)
-                    p0 = next((p for p in people if _normalize(p.get("fullName","")) == norm_target), people[0])
-                    pid = int(p0["id"])
-                    pdata = _fetch_json(client, f"{MLB_BASE}/people/{pid}", params={"hydrate": f"team,stats(group=hitting,type=season,season={season})"})
-                    person = (pdata.get("people") or [{}])[0]
-                    if not _qualify_by_ab_gp(person):
-                        continue
-                    if verify_effective == 1:
-                        team_info = person.get("currentTeam") or {}
-                        try:
-                            team_id = int(team_info.get("id")) if team_info.get("id") is not None else None
-                        except Exception:
-                            team_id = None
-                        if team_id is None or team_id not in ns_team_ids_today:
-                            continue
-                    _decorate_and_add(person, pid, effective_date)
-                    if len(candidates) >= limit:
-                        break
-                except Exception as e:
+    # league mode or explicit names
+    if names:
+        requested = [n.strip() for n in names.split(",") if n.strip()]
+        resolved: List[Tuple[str, int]] = []
+        for name in requested:
+            try:
+                data = _fetch_json(client, f"{MLB_BASE}/people/search", params={"names": name})
+                people = data.get("people", []) or []
+                if not people:
                     if debug_list is not None:
-                        debug_list.append({"name": name, "error": f"{type(e).__name__}: {e}"})
-        else:
-            # league scan
-            scan_team_ids = sorted(ns_team_ids_today) if verify_effective == 1 else slate_team_ids_today
-            union_ids, team_map = _collect_union_player_ids(client, scan_team_ids, season, debug_list)
-            people = _batch_people_with_stats(client, union_ids, season, debug_list)
-
-            # normalize team
-            for p in people:
-                if not p.get("currentTeam"):
-                    pid = p.get("id")
-                    if isinstance(pid, int) and pid in team_map:
-                        tid, tname = team_map[pid]
-                        p["currentTeam"] = {"id": tid, "name": tname}
-
-            prospects: List[Tuple[float, Dict]] = []
-            for p in people:
-                season_avg = _season_avg_from_people_like(p)
-                if season_avg is None or season_avg < min_season_avg:
+                        debug_list.append({"name": name, "skip": "player not found"})
                     continue
-                ab, gp = _season_ab_gp_from_people_like(p)
-                if ab is None or gp is None or ab < min_season_ab or gp < min_season_gp:
-                    continue
-                try:
-                    pid = int(p.get("id"))
-                except Exception:
-                    pid = None
-                if pid is None:
+                norm_target = _normalize(name)
+                p0 = next((p for p in people if _normalize(p.get("fullName","")) == norm_target), people[0])
+                resolved.append((name, int(p0["id"])))
+            except Exception as e:
+                if debug_list is not None:
+                    debug_list.append({"name": name, "error": f"{type(e).__name__}: {e}"})
+
+        # season + gameLog for every resolved name via batched /people?personIds instead of one GET per name;
+        # sportId=1 keeps minor-league/rehab splits (also gameType "R") out, like the standalone gameLog call
+        by_pid: Dict[int, Dict] = {}
+        resolved_ids = [pid for _, pid in resolved]
+        for i in range(0, len(resolved_ids), 100):
+            sub = resolved_ids[i:i+100]
+            try:
+                pdata = _fetch_json(client, f"{MLB_BASE}/people", params={
+                    "personIds": ",".join(str(x) for x in sub),
+                    "hydrate": f"team,stats(group=hitting,type=[season,gameLog],season={season},sportId=1)",
+                })
+                for person in pdata.get("people", []) or []:
+                    if person.get("id") is not None:
+                        by_pid[int(person["id"])] = person
+            except Exception as e:
+                if debug_list is not None:
+                    debug_list.append({"names_people_chunk": len(sub), "error": f"{type(e).__name__}: {e}"})
+
+        for name, pid in resolved:
+            person = by_pid.get(pid)
+            if person is None:
+                if debug_list is not None:
+                    debug_list.append({"name": name, "skip": "player not returned"})
+                continue
+            try:
+                hydrated_logs = _hydrated_game_log(person)
+                if not _qualify_by_ab_gp(person):
                     continue
                 if verify_effective == 1:
-                    team_info = p.get("currentTeam") or {}
+                    team_info = person.get("currentTeam") or {}
                     try:
                         team_id = int(team_info.get("id")) if team_info.get("id") is not None else None
                     except Exception:
                         team_id = None
                     if team_id is None or team_id not in ns_team_ids_today:
                         continue
-                prospects.append((float(season_avg), {"pid": pid, "person": p}))
-
-            prospects.sort(key=lambda x: x[0], reverse=True)
-
-            checks = 0
-            for _, meta in prospects:
-                if checks >= MAX_LOG_CHECKS or len(candidates) >= limit:
+                logs = _regular_season_desc(hydrated_logs, 160) if hydrated_logs is not None else None
+                _decorate_and_add(person, pid, effective_date, logs=logs)
+                if len(candidates) >= limit:
                     break
-                checks += 1
-                try:
-                    _decorate_and_add(meta["person"], meta["pid"], effective_date, team_map)
-                except Exception as e:
-                    if debug_list is not None:
-                        dbg_name = (meta["person"] or {}).get("fullName","")
-                        debug_list.append({"name": dbg_name, "error": f"{type(e).__name__}: {e}"})
-
-        # group/sort
-        if group_mode == "streak":
-            buckets: Dict[int, List[Dict]] = {}
-            for c in candidates:
-                buckets.setdefault(int(c.get("hitless_streak", 0)), []).append(c)
-            out_list: List[Dict] = []
-            for k in sorted(buckets.keys(), reverse=True):
-                grp = sorted(buckets[k], key=lambda x: float(x.get("ranking_score", x.get("score", 0.0))), reverse=True)
-                out_list.extend(grp)
-            candidates = out_list[:limit]
-        else:
-            if sort_spec:
-                candidates = _apply_sort(candidates, sort_spec)
-            else:
-                candidates = sorted(candidates, key=lambda x: (float(x.get("ranking_score", x.get("score", 0.0))), float(x.get("season_avg", 0.0))), reverse=True)
-            candidates = candidates[:limit]
-
-        # Build Tier S / A — Statcast gate enforced if require_statcast_for_tiers=1
-        best_targets_s: List[Dict] = []
-        best_targets_a: List[Dict] = []
-        for c in candidates:
-            hit_ch = float(c.get("hit_chance_pct", 0.0))
-            overdue = float(c.get("overdue_ratio", 0.0))
-            comp = float(c.get("composite", 0.0))
-            sc = c.get("_statcast", {}) or {}
-            has_sig = bool(sc.get("has_signal"))
-
-            # enforce gate
-            if require_statcast_for_tiers == 1 and not has_sig:
+            except Exception as e:
+                if debug_list is not None:
+                    debug_list.append({"name": name, "error": f"{type(e).__name__}: {e}"})
+    else:
+        # league scan
+        scan_team_ids = sorted(ns_team_ids_today) if verify_effective == 1 else slate_team_ids_today
+        union_ids, team_map = _collect_union_player_ids(client, scan_team_ids, season, debug_list)
+        people = _batch_people_with_stats(client, union_ids, season, debug_list)
+
+        # normalize team; people come from the shared response cache, so copy instead of mutating
+        for i, p in enumerate(people):
+            if not p.get("currentTeam"):
+                pid = p.get("id")
+                if isinstance(pid, int) and pid in team_map:
+                    tid, tname = team_map[pid]
+                    people[i] = {**p, "currentTeam": {"id": tid, "name": tname}}
+
+        prospects: List[_Prospect] = []
+        for p in people:
+            season_stat = _season_hitting_stat(p)
+            season_avg = _season_avg_from_stat(season_stat)
+            if season_avg is None or season_avg < min_season_avg:
                 continue
+            ab, gp = _season_ab_gp_from_stat(season_stat)
+            if ab is None or gp is None or ab < min_season_ab or gp < min_season_gp:
+                continue
+            try:
+                pid = int(p.get("id"))
+            except Exception:
+                pid = None
+            if pid is None:
+                continue
+            if verify_effective == 1:
+                team_info = p.get("currentTeam") or {}
+                try:
+                    team_id = int(team_info.get("id")) if team_info.get("id") is not None else None
+                except Exception:
+                    team_id = None
+                if team_id is None or team_id not in ns_team_ids_today:
+                    continue
+            prospects.append(_Prospect(float(season_avg), pid, p))
+
+        # at most MAX_LOG_CHECKS prospects are ever visited: select them, don't sort the league
+        prospects = heapq.nlargest(max(0, int(MAX_LOG_CHECKS)), prospects, key=lambda x: x.season_avg)
+
+        # gameLogs are prefetched a wave at a time in parallel; candidates are still
+        # evaluated in prospect order and the scan stops once `limit` is reached
+        with ThreadPoolExecutor(max_workers=_LOG_FETCH_WORKERS) as pool:
+            i = 0
+            while i < len(prospects) and len(candidates) < limit:
+                # size the wave by the room left so a small limit doesn't burn a full wave of gameLogs
+                size = min(_LOG_FETCH_WORKERS, max(1, (limit - len(candidates)) * _LOG_WAVE_PER_SLOT))
+                wave = prospects[i:i + size]
+                i += size
+                wave_logs = list(pool.map(lambda pr: _fetch_logs(pr.pid), wave))
+                for pr, logs in zip(wave, wave_logs):
+                    if len(candidates) >= limit:
+                        break
+                    try:
+                        _decorate_and_add(pr.person, pr.pid, effective_date, team_map, logs)
+                    except Exception as e:
+                        if debug_list is not None:
+                            dbg_name = (pr.person or {}).get("fullName","")
+                            debug_list.append({"name": dbg_name, "error": f"{type(e).__name__}: {e}"})
 
-            if comp >= tier_s_min_composite and (hit_ch >= tier_s_min_hit_chance or overdue >= tier_s_min_overdue):
-                best_targets_s.append(c)
-            elif comp >= tier_a_min_composite and hit_ch >= tier_a_min_hit_chance:
-                best_targets_a.append(c)
-
-        response: Dict[str, Any] = {"date": effective_date, "candidates": candidates}
-        response["schedule"] = [{"matchup": row[0], "statusCode": row[1], "statusText": row[3], "gamePk": row[2]} for row in sched_rows]
-        response["pregame_counts"] = {
-            "pregame_teams": len(ns_team_ids_today),
-            "slate_teams": len(slate_team_ids_today),
-        }
-        response["best_targets"] = {
-            "tier_s": best_targets_s,
-            "tier_a": best_targets_a,
-        }
+    # group/sort
+    if group_mode == "streak":
+        buckets: Dict[int, List[Dict]] = {}
+        for c in candidates:
+            buckets.setdefault(int(c.get("hitless_streak", 0)), []).append(c)
+        out_list: List[Dict] = []
+        for k in sorted(buckets.keys(), reverse=True):
+            room = limit - len(out_list)
+            if room <= 0:
+                break
+            out_list.extend(heapq.nlargest(room, buckets[k], key=lambda x: float(x.get("ranking_score", x.get("score", 0.0)))))
+        candidates = out_list
+    else:
+        if sort_spec:
+            candidates = _apply_sort(candidates, sort_spec, limit)
+        else:
+            # top-k only; same result as sorted(..., reverse=True)[:limit]
+            candidates = heapq.nlargest(limit, candidates, key=lambda x: (float(x.get("ranking_score", x.get("score", 0.0))), float(x.get("season_avg", 0.0))))
+
+    # Build Tier S / A — Statcast gate enforced if require_statcast_for_tiers=1
+    best_targets_s: List[Dict] = []
+    best_targets_a: List[Dict] = []
+    for c in candidates:
+        hit_ch = float(c.get("hit_chance_pct", 0.0))
+        overdue = float(c.get("overdue_ratio", 0.0))
+        comp = float(c.get("composite", 0.0))
+        sc = c.get("_statcast") or {}
+        has_sig = bool(sc.get("has_signal"))
+
+        # enforce gate
+        if require_statcast_for_tiers == 1 and not has_sig:
+            continue
 
-        if debug_list is not None:
-            stamp = {
-                "requested_date": requested_date,
-                "effective_date": effective_date,
-                "verify": int(verify_effective),
-                "rolled_to_next_slate": bool(rolled),
-                "pregame_team_count": len(ns_team_ids_today),
-                "slate_team_count": len(slate_team_ids_today),
-                "cutoffs": {
-                    "min_season_avg": min_season_avg,
-                    "min_hitless_games": min_hitless_games,
-                    "min_season_ab": min_season_ab,
-                    "min_season_gp": min_season_gp,
-                    "limit": limit,
-                    "scan_multiplier": DEFAULT_MULT,
-                    "max_log_checks": MAX_LOG_CHECKS,
-                },
-                "statcast": {
-                    "wired": _STATCAST_OK,
-                    "require_statcast_for_tiers": require_statcast_for_tiers,
-                    "hh_recent_days": hh_recent_days,
-                    "statcast_min_hh_14d": statcast_min_hh_14d,
-                    "statcast_min_xba_delta_14d": statcast_min_xba_delta_14d,
-                },
-                "weights": {
-                    "w_hit_chance": w_hit_chance,
-                    "w_overdue": w_overdue,
-                    "w_elite_avg": w_elite_avg,
-                    "w_statcast": w_statcast,
-                    "w_pitcher": w_pitcher,
-                    "w_platoon": w_platoon,
-                    "w_park": w_park,
-                },
-                "params": {
-                    "mode": mode_norm or None,
-                    "as_of": as_of_norm or None,
-                    "group_by": group_mode,
-                    "sort_by": sort_by or None,
-                }
+        if comp >= tier_s_min_composite and (hit_ch >= tier_s_min_hit_chance or overdue >= tier_s_min_overdue):
+            best_targets_s.append(c)
+        elif comp >= tier_a_min_composite and hit_ch >= tier_a_min_hit_chance:
+            best_targets_a.append(c)
+
+    response: Dict[str, Any] = {"date": effective_date, "candidates": candidates}
+    response["schedule"] = [{"matchup": row[0], "statusCode": row[1], "statusText": row[3], "gamePk": row[2]} for row in sched_rows]
+    response["pregame_counts"] = {
+        "pregame_teams": len(ns_team_ids_today),
+        "slate_teams": len(slate_team_ids_today),
+    }
+    response["best_targets"] = {
+        "tier_s": best_targets_s,
+        "tier_a": best_targets_a,
+    }
+
+    if debug_list is not None:
+        stamp = {
+            "requested_date": requested_date,
+            "effective_date": effective_date,
+            "verify": int(verify_effective),
+            "rolled_to_next_slate": bool(rolled),
+            "pregame_team_count": len(ns_team_ids_today),
+            "slate_team_count": len(slate_team_ids_today),
+            "cutoffs": {
+                "min_season_avg": min_season_avg,
+                "min_hitless_games": min_hitless_games,
+                "min_season_ab": min_season_ab,
+                "min_season_gp": min_season_gp,
+                "limit": limit,
+                "scan_multiplier": DEFAULT_MULT,
+                "max_log_checks": MAX_LOG_CHECKS,
+            },
+            "statcast": {
+                "wired": _STATCAST_OK,
+                "require_statcast_for_tiers": require_statcast_for_tiers,
+                "hh_recent_days": hh_recent_days,
+                "statcast_min_hh_14d": statcast_min_hh_14d,
+                "statcast_min_xba_delta_14d": statcast_min_xba_delta_14d,
+            },
+            "weights": {
+                "w_hit_chance": w_hit_chance,
+                "w_overdue": w_overdue,
+                "w_elite_avg": w_elite_avg,
+                "w_statcast": w_statcast,
+                "w_pitcher": w_pitcher,
+                "w_platoon": w_platoon,
+                "w_park": w_park,
+            },
+            "params": {
+                "mode": mode_norm or None,
+                "as_of": as_of_norm or None,
+                "group_by": group_mode,
+                "sort_by": sort_by or None,
             }
-            response["debug"] = [stamp] + (debug_list or [])
-        return response
+        }
+        response["debug"] = [stamp] + (debug_list or [])
+    return response
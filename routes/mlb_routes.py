@@ -5,11 +5,12 @@ from typing import Any, Dict, Optional, List
 from fastapi import APIRouter, HTTPException, Query, Request
 import pytz
 
+_ET = pytz.timezone("America/New_York")
+
 router = APIRouter(prefix="/mlb", tags=["mlb"])
 
 def _parse_date(d: Optional[str]) -> date_cls:
-    tz = pytz.timezone("America/New_York")
-    now = datetime.now(tz).date()
+    now = datetime.now(_ET).date()
     if not d or d.lower() == "today":
         return now
     s = d.lower()
@@ -2,24 +2,49 @@
 from __future__ import annotations
 
 from datetime import datetime, timedelta
-from fastapi import APIRouter, Query
+from typing import Optional
+from fastapi import APIRouter, Query, Response
 import httpx
 import pytz
 
+from providers.statsapi_client import HTTP2_AVAILABLE
+
+_ET = pytz.timezone("America/New_York")
+
 router = APIRouter()
 STATSAPI_BASE = "https://statsapi.mlb.com/api/v1"
 
+# one keep-alive AsyncClient for the process, created on first use inside the server's event loop
+_client: Optional[httpx.AsyncClient] = None
+
+def _async_client() -> httpx.AsyncClient:
+    global _client
+    if _client is None or _client.is_closed:
+        _client = httpx.AsyncClient(
+            http2=HTTP2_AVAILABLE,
+            timeout=15.0,
+            limits=httpx.Limits(max_connections=32, max_keepalive_connections=32),
+            headers={"Accept": "application/json"},
+        )
+    return _client
+
+async def _aclose_client() -> None:
+    """Close the shared AsyncClient; the next request would open a fresh one."""
+    if _client is not None and not _client.is_closed:
+        await _client.aclose()
+
+# runs on app shutdown once this router is included
+router.add_event_handler("shutdown", _aclose_client)
+
 def _normalize_date(date_str: str | None) -> str:
     """
     Normalize 'today' to America/New_York date to match your app’s convention.
     Otherwise pass through YYYY-MM-DD.
     """
     if not date_str or date_str.lower() == "today":
-        et = pytz.timezone("America/New_York")
-        return datetime.now(et).strftime("%Y-%m-%d")
+        return datetime.now(_ET).strftime("%Y-%m-%d")
     if date_str.lower() in ("tomorrow", "yesterday"):
-        et = pytz.timezone("America/New_York")
-        now = datetime.now(et)
+        now = datetime.now(_ET)
         if date_str.lower() == "tomorrow":
             return (now + timedelta(days=1)).strftime("%Y-%m-%d")
         else:
@@ -33,11 +58,10 @@ def _normalize_date(date_str: str | None) -> str:
 async def schedule_for_date(date: str = Query("today")):
     """Proxy MLB schedule so /schedule_for_date and /mlb/schedule_for_date return 200 with JSON."""
     date_str = _normalize_date(date)
-    async with httpx.AsyncClient(timeout=15.0) as client:
-        r = await client.get(
-            f"{STATSAPI_BASE}/schedule",
-            params={"sportId": 1, "date": date_str},
-            headers={"Accept": "application/json"},
-        )
-        r.raise_for_status()
-        return r.json()
+    r = await _async_client().get(
+        f"{STATSAPI_BASE}/schedule",
+        params={"sportId": 1, "date": date_str},
+    )
+    r.raise_for_status()
+    # StatsAPI already sends JSON: pass the bytes through instead of decoding and re-encoding
+    return Response(content=r.content, media_type="application/json")
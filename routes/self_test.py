@@ -6,6 +6,8 @@ import pytz
 from fastapi import APIRouter, Query, Request
 from fastapi.responses import JSONResponse
 
+_ET = pytz.timezone("America/New_York")
+
 # Force UTF-8 so names like “Agustín Ramírez” render correctly everywhere
 class UTF8JSONResponse(JSONResponse):
     media_type = "application/json; charset=utf-8"
@@ -16,8 +18,7 @@ router = APIRouter()
 # Local helpers (no import of main to avoid circular import)
 # ------------------
 def parse_date(d: Optional[str]) -> date_cls:
-    tz = pytz.timezone("America/New_York")
-    now = datetime.now(tz).date()
+    now = datetime.now(_ET).date()
     if not d or d.lower() == "today":
         return now
     s = d.lower()
@@ -117,9 +118,7 @@ def self_test(
     provider_module = getattr(app.state, "provider_module", None)
     provider_class = getattr(app.state, "provider_class", None)
     last_provider_error = getattr(app.state, "last_provider_error", None)
-
-    tz = pytz.timezone("America/New_York")
-    now_str = datetime.now(tz).strftime("%Y-%m-%d %H:%M:%S %Z")
+    now_str = datetime.now(_ET).strftime("%Y-%m-%d %H:%M:%S %Z")
     the_date = parse_date(date)
 
     # Build calls that accept either date_str or date, and either top_n/n/limit
@@ -4,9 +4,10 @@ from fastapi import HTTPException
 import pytz
 from typing import Optional
 
+_ET = pytz.timezone("America/New_York")
+
 def parse_date(d: Optional[str]) -> date_cls:
-    tz = pytz.timezone("America/New_York")
-    now = datetime.now(tz).date()
+    now = datetime.now(_ET).date()
     if not d or d.lower() == "today":
         return now
     s = d.lower()
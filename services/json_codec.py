@@ -0,0 +1,20 @@
+# services/json_codec.py
+from __future__ import annotations
+
+import json
+from typing import Any, Union
+
+# orjson is optional: fall back to the stdlib decoder when it isn't installed.
+try:
+    import orjson
+    _ORJSON_OK = True
+except Exception:
+    orjson = None  # type: ignore
+    _ORJSON_OK = False
+
+
+def loads(data: Union[bytes, str]) -> Any:
+    """Decode a JSON body (raw bytes preferred) with orjson when available."""
+    if _ORJSON_OK:
+        return orjson.loads(data)
+    return json.loads(data)
@@ -0,0 +1,21 @@
+# services/statsapi_json.py
+from __future__ import annotations
+
+from typing import Any, Dict
+
+
+def dig(d: Any, *keys: Any, default: Any = None) -> Any:
+    """Walk nested dicts without allocating `{}` fallbacks; missing/None/non-dict -> default."""
+    for k in keys:
+        if not isinstance(d, dict):
+            return default
+        d = d.get(k)
+        if d is None:
+            return default
+    return d
+
+
+def is_pitcher_entry(entry: Dict[str, Any]) -> bool:
+    """Roster entry is a pure pitcher (code "1" / "P"); two-way "TWP" players still hit."""
+    pos = entry.get("position") or dig(entry, "person", "primaryPosition") or {}
+    return pos.get("code") == "1" or pos.get("abbreviation") == "P"
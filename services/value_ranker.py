@@ -9,6 +9,7 @@ from datetime import date, timedelta
 from typing import Any, Dict, Iterable, List, Optional, Tuple
 
 import requests
+from requests.adapters import HTTPAdapter
 
 try:
     # Optional but best way to resolve MLBAM ids.
@@ -28,6 +29,10 @@ _UA = (
 _CACHE: Dict[str, Dict[str, Any]] = {}
 _CACHE_TTL_SEC = 600  # 10 minutes
 
+# keep-alive pool shared by every Savant fetch (retries stay in the fetch loop below)
+_SESSION = requests.Session()
+_SESSION.mount("https://", HTTPAdapter(pool_connections=8, pool_maxsize=32))
+
 
 @dataclass
 class StatcastSignal:
@@ -112,13 +117,13 @@ def _fetch_statcast_csv(
         "opponent": "", "pitcher_throws": "", "batter_stands": "", "metric_1": "", "rehab": "",
     }
 
-    headers = {"User-Agent": _UA, "Accept": "text/csv"}
+    headers = {"User-Agent": _UA, "Accept": "text/csv", "Accept-Encoding": "gzip"}
 
     attempt = 0
     while True:
         attempt += 1
         try:
-            r = requests.get(STATCAST_SEARCH_CSV_URL, params=params, headers=headers, timeout=timeout)
+            r = _SESSION.get(STATCAST_SEARCH_CSV_URL, params=params, headers=headers, timeout=timeout)
             r.raise_for_status()
             buff = io.StringIO(r.text)
             reader = csv.DictReader(buff)
@@ -5,6 +5,8 @@ from typing import Any, Dict, List, Tuple, Set
 from datetime import date as date_cls
 import inspect
 
+from services.statsapi_json import dig as _dig
+
 def _call_with_sig(fn, **kwargs):
     try:
         sig = inspect.signature(fn)
@@ -29,7 +31,7 @@ def collect_not_started_team_ids(schedule_obj: Any) -> Set[int]:
         dates = (schedule_obj or {}).get("dates", [])
         for d in dates:
             for g in d.get("games", []):
-                st = g.get("status", {}) or {}
+                st = g.get("status") or {}
                 abstract = (st.get("abstractGameState") or "").strip()
                 detailed = (st.get("detailedState") or "").strip()
                 not_started = (
@@ -38,7 +40,7 @@ def collect_not_started_team_ids(schedule_obj: Any) -> Set[int]:
                 )
                 if not_started:
                     for side in ("home", "away"):
-                        tid = ((g.get("teams", {}) or {}).get(side, {}) or {}).get("team", {}).get("id")
+                        tid = _dig(g, "teams", side, "team", "id")
                         if isinstance(tid, int):
                             ids.add(tid)
     except Exception: